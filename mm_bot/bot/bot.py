@@ -1,5 +1,7 @@
 import asyncio
 import csv
+import dataclasses
+import os
 import time
 from decimal import Decimal
 from typing import Set, List, Optional, Dict
@@ -23,26 +25,52 @@ from mm_bot.kuru_imports import (
     KuruOrderError,
     KuruTimeoutError,
 )
-from mm_bot.config.config import BotConfig, load_influx_config
+from mm_bot.config.config import BotConfig, load_influx_config, parse_toml_cached
 from mm_bot.config.config_watcher import ConfigWatcher
 from mm_bot.monitoring.influx import InfluxWriter, _extract_quoter_id
 from mm_bot.quoter.base import BaseQuoter
 from mm_bot.quoter.context import ExistingOrder, QuoterContext
 from mm_bot.quoter.registry import get_quoter_class
-from mm_bot.position.position_tracker import PositionTracker
+from mm_bot.position.position_tracker import (
+    PositionTracker,
+    _log_timestamp,
+    _to_decimal,
+    _tracking_dir,
+)
 from mm_bot.pricing.oracle import OracleService, KuruPriceSource, CoinbasePriceSource
 from mm_bot.pnl.tracker import PnlTracker
 
+# Hard cap on outstanding pre-registrations. Entries are normally cleared by
+# ORDER_PLACED / fill callbacks or the stale sweep; the cap only matters if
+# callbacks stop arriving entirely (e.g. websocket down for a long stretch).
+MAX_PREREGISTERED_ORDERS = 10_000
+
+# How long a get_active_orders() result may be reused within an iteration
+# (reconcile/validation and the main loop run back-to-back on the same tick).
+ACTIVE_ORDERS_CACHE_TTL = 0.25  # seconds
+
+# Main-loop reuse window when no order callback has arrived since the last fetch.
+# Our on-chain orders only change via our own place/cancel calls or fills, all of
+# which invalidate the snapshot, so a quiet snapshot stays accurate for longer.
+ACTIVE_ORDERS_QUIET_TTL = 2.0  # seconds
+
+# Side prefixes of every cloid this bot generates ('{side}-{quoter_id}-{timestamp_ms}').
+# All are 4 chars, so ownership is one slice + set probe.
+_OUR_PREFIXES: frozenset[str] = frozenset({"bid-", "ask-"})
+
+_ZERO = Decimal("0")
 
-def _to_decimal(value) -> Decimal:
-    """Convert numeric values to Decimal without binary float artifacts."""
-    if isinstance(value, Decimal):
-        return value
-    return Decimal(str(value))
+
+def _cloid_prefix(cloid: str) -> str:
+    """Strip the timestamp from '{side}-{quoter_id}-{timestamp_ms}', keeping the trailing '-'."""
+    return cloid[:cloid.rfind("-") + 1]
 
 
 class OrderInfo:
     """Local representation of an active order for inventory tracking."""
+    # One instance per live order: slots drop the per-instance __dict__
+    __slots__ = ("cloid", "side", "price", "size", "order_id")
+
     def __init__(
         self,
         cloid: str,
@@ -58,6 +86,15 @@ class OrderInfo:
         self.order_id = order_id
 
 
+class PreregInfo:
+    """An order sent but not yet confirmed by ORDER_PLACED (for immediate-fill matching)."""
+    __slots__ = ("size", "timestamp")
+
+    def __init__(self, size: Decimal, timestamp: float):
+        self.size = size
+        self.timestamp = timestamp  # time.monotonic() at pre-registration
+
+
 class Bot:
     """
     Market making bot using the kuru-sdk-py SDK.
@@ -80,40 +117,88 @@ class Bot:
         self.market_config = sdk_configs["market_config"]
         self.bot_config = bot_config
 
-        # Setup debug log file
-        debug_log_dir = Path("tracking")
-        debug_log_dir.mkdir(exist_ok=True)
+        # Market scaling factors are fixed for the bot's lifetime; convert once
+        # instead of re-walking market_config and rebuilding Decimals per call
+        self._price_precision = Decimal(self.market_config.price_precision)
+        self._size_precision = Decimal(self.market_config.size_precision)
+        self._base_scale = Decimal(10 ** self.market_config.base_token_decimals)
+        self._quote_scale = Decimal(10 ** self.market_config.quote_token_decimals)
+        self._market_address = self.market_config.market_address
+
+        # Drive quoting from callback-tracked orders only (no per-tick get_active_orders)
+        self._orders_from_callbacks = os.getenv("ORDERS_FROM_CALLBACKS", "false").strip().lower() in ("1", "true", "yes")
+
+        # Setup debug log file (POSITION_DEBUG_LOG=false turns _debug_log into a no-op)
+        self._debug_enabled = os.getenv("POSITION_DEBUG_LOG", "true").strip().lower() not in ("0", "false", "no")
+        # Per-order dump and "drift stable" detail in each reconciliation (off by default)
+        self._debug_verbose_reconcile = self._debug_enabled and os.getenv(
+            "POSITION_DEBUG_VERBOSE_RECONCILE", "false"
+        ).strip().lower() in ("1", "true", "yes")
+        debug_log_dir = _tracking_dir()
         self.debug_log_path = debug_log_dir / "position_debug.log"
 
-        # Create/clear debug log file
-        with open(self.debug_log_path, 'w') as f:
-            f.write(f"=== Position Debug Log - Started {datetime.now().isoformat()} ===\n\n")
+        # Kept open for the bot's lifetime with a large buffer; flushed once per
+        # main-loop iteration (_flush_debug_log) and closed in stop()
+        self._debug_fh = None
+
+        # Reconciliation CSV, opened lazily by _get_reconcile_writer() and closed in stop()
+        self._reconcile_csv_fh = None
+        self._reconcile_csv_writer = None
+        if self._debug_enabled:
+            # Create/clear debug log file
+            self._debug_fh = open(self.debug_log_path, 'w', buffering=65536)
+            self._debug_fh.write(f"=== Position Debug Log - Started {datetime.now().isoformat()} ===\n\n")
 
-        logger.warning(f"[DEBUG] Writing debug logs to: {self.debug_log_path}")
+            logger.warning(f"[DEBUG] Writing debug logs to: {self.debug_log_path}")
 
         # Client and tracking
         self.client: Optional[KuruClient] = None
         self.active_cloids: Set[str] = set()
+        # Index of active_cloids by cloid prefix ("bid-{quoter_id}-" / "ask-{quoter_id}-"),
+        # kept in sync by _add_active_cloid / _discard_active_cloid
+        self._active_cloids_by_prefix: Dict[str, Set[str]] = {}
         self.cloid_to_order_id: Dict[str, int] = {}  # Track cloid → order_id mapping
         self.order_id_to_cloid: Dict[int, str] = {}  # Track order_id → cloid mapping
         self.order_sizes: Dict[str, Decimal] = {}  # Track cloid → original_size for fill calculation
         self.last_reconcile_time: float = 0.0
 
         # Pre-registration for immediate fills (orders sent but not yet confirmed)
-        self.preregistered_orders: Dict[str, tuple[Decimal, float]] = {}  # cloid → (size, timestamp)
+        self.preregistered_orders: Dict[str, PreregInfo] = {}  # cloid → PreregInfo
+        # Index of preregistered_orders by cloid prefix, kept in sync by
+        # _preregister_order / _pop_preregistration
+        self._prereg_by_prefix: Dict[str, Set[str]] = {}
 
         # Active orders tracked from callbacks (for inventory, no API calls needed)
         self.active_orders: Dict[str, OrderInfo] = {}  # cloid → OrderInfo
+        # Running totals of inventory locked by active_orders, kept in step with it by
+        # _lock_order / _unlock_order so get_locked_inventory() needn't scan
+        self._locked_base = _ZERO
+        self._locked_quote = _ZERO
 
         # Orphaned order tracking (orders on chain but no callback received)
         self.orphaned_order_timestamps: Dict[int, float] = {}  # order_id → first_seen_timestamp
 
+        # Phantom suspects (tracked but missing from the API on the last full validation).
+        # The REST list lags on-chain state, so an order is only treated as a phantom
+        # once it is missing on two consecutive full validations.
+        self._phantom_suspect_ids: Set[int] = set()
+
         # Recently cancelled order IDs (cancel callback received but REST API still shows them)
         self.recently_cancelled_order_ids: Dict[int, float] = {}  # order_id → cancel_timestamp
 
         # Validation counter for periodic API checks
         self._validation_counter: int = 0
 
+        # Last get_active_orders() result: (monotonic_fetch_time, orders)
+        self._active_orders_snapshot: Optional[tuple[float, list]] = None
+        # In-flight fetch shared by concurrent callers (detached on invalidation),
+        # and a generation counter bumped on invalidation so a fetch started before
+        # an order change doesn't repopulate the snapshot with pre-change data
+        self._active_orders_inflight: Optional[asyncio.Future] = None
+        self._active_orders_generation: int = 0
+        # _index_on_chain_orders() result for the last parsed list: (orders, generation, index)
+        self._on_chain_index: Optional[tuple[list, int, Dict[str, OrderInfo]]] = None
+
         # InfluxDB metrics writer (None until start())
         self.influx: Optional[InfluxWriter] = None
 
@@ -135,11 +220,16 @@ class Bot:
         # Set up the configured price source
         self.kuru_price_source = None
         if self.oracle_source == "kuru":
-            self.kuru_price_source = KuruPriceSource(depth_state=bot_config.kuru_depth_state)
+            self.kuru_price_source = KuruPriceSource(
+                depth_state=bot_config.kuru_depth_state,
+                max_book_age=bot_config.kuru_max_book_age,
+            )
             self.oracle_service.add_price_source("kuru", self.kuru_price_source)
         else:
             self.coinbase_price_source = CoinbasePriceSource(symbol=self.bot_config.coinbase_symbol)
             self.oracle_service.add_price_source("coinbase", self.coinbase_price_source)
+        # oracle_source can't change without a restart, so resolve the source once
+        self._price_source = self.oracle_service.resolve(self.oracle_source)
 
         # PnL tracker (will be initialized after position tracker in start())
         self.pnl_tracker: Optional[PnlTracker] = None
@@ -155,12 +245,177 @@ class Bot:
 
         self.shutdown_event = asyncio.Event()
 
+        # order_callback dispatch: one dict lookup per event instead of an if/elif
+        # chain of enum comparisons (bound methods cached once)
+        self._status_handlers = {
+            OrderStatus.ORDER_PLACED: self._on_order_placed,
+            OrderStatus.ORDER_CANCELLED: self._on_order_cancelled,
+            OrderStatus.ORDER_FULLY_FILLED: self._on_order_fully_filled,
+            OrderStatus.ORDER_PARTIALLY_FILLED: self._on_order_partially_filled,
+            OrderStatus.ORDER_TIMEOUT: self._on_order_timeout,
+            OrderStatus.ORDER_FAILED: self._on_order_failed,
+        }
+        # Long-lived shutdown_event.wait() task reused by every idle sleep
+        self._shutdown_waiter: Optional[asyncio.Task] = None
+
     def _debug_log(self, message: str) -> None:
-        """Write to both logger and debug file."""
+        """
+        Write to both logger and debug file.
+
+        Hot paths check self._debug_enabled before calling so the f-string
+        arguments aren't formatted when debug logging is off.
+        """
+        if not self._debug_enabled:
+            return
         logger.debug(message)
-        with open(self.debug_log_path, 'a') as f:
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            f.write(f"[{timestamp}] {message}\n")
+        if self._debug_fh is not None:
+            self._debug_fh.write(f"[{_log_timestamp()}] {message}\n")
+
+    def _debug_logf(self, fmt: str, *args) -> None:
+        """
+        Deferred-format variant of _debug_log: fmt.format(*args) only runs when
+        debug logging is enabled, so callers needn't guard single-line traces.
+        """
+        if self._debug_enabled:
+            self._debug_log(fmt.format(*args))
+
+    def _flush_debug_log(self) -> None:
+        """Push buffered debug lines to disk (one write syscall instead of one per line)."""
+        if self._debug_fh is not None:
+            try:
+                self._debug_fh.flush()
+            except OSError as e:
+                logger.warning(f"Failed to flush debug log: {e}")
+
+    def _preregister_order(self, cloid: str, size: Decimal, timestamp: float) -> None:
+        """
+        Pre-register an order before sending it so immediate fills can be matched.
+
+        Keeps preregistered_orders bounded: when the cap is reached the oldest
+        entry (dicts preserve insertion order) is dropped together with its
+        order_sizes entry.
+        """
+        if len(self.preregistered_orders) >= MAX_PREREGISTERED_ORDERS:
+            oldest = next(iter(self.preregistered_orders))
+            self._pop_preregistration(oldest)
+            self.order_sizes.pop(oldest, None)
+            logger.warning(
+                f"⚠️ Pre-registration cap ({MAX_PREREGISTERED_ORDERS}) reached, evicted {oldest}"
+            )
+
+        self.preregistered_orders[cloid] = PreregInfo(size, timestamp)
+        self._prereg_by_prefix.setdefault(_cloid_prefix(cloid), set()).add(cloid)
+        self.order_sizes[cloid] = size
+
+    def _pop_preregistration(self, cloid: str) -> Optional[PreregInfo]:
+        """Remove a pre-registration and its prefix index entry; returns it, or None."""
+        entry = self.preregistered_orders.pop(cloid, None)
+        if entry is not None:
+            prefix = _cloid_prefix(cloid)
+            cloids = self._prereg_by_prefix.get(prefix)
+            if cloids is not None:
+                cloids.discard(cloid)
+                if not cloids:
+                    del self._prereg_by_prefix[prefix]
+        return entry
+
+    def _reset_order_tracking(self) -> None:
+        """
+        Drop all local order tracking after a full cancel.
+
+        Rebinds fresh containers rather than calling .clear(): CPython keeps a
+        cleared dict's table allocated, so a reset after a large backlog would
+        otherwise hold onto that memory indefinitely.
+        """
+        self.active_orders = {}
+        self._locked_base = _ZERO
+        self._locked_quote = _ZERO
+        self.order_sizes = {}
+        self.preregistered_orders = {}
+        self._prereg_by_prefix = {}
+        self.active_cloids = set()
+        self._active_cloids_by_prefix = {}
+        self.cloid_to_order_id = {}
+        self.order_id_to_cloid = {}
+        self.orphaned_order_timestamps = {}
+        self._phantom_suspect_ids = set()
+        self._invalidate_active_orders_cache()
+
+    def _add_active_cloid(self, cloid: str) -> None:
+        """Add a cloid to active_cloids and the per-quoter prefix index."""
+        self.active_cloids.add(cloid)
+        self._active_cloids_by_prefix.setdefault(_cloid_prefix(cloid), set()).add(cloid)
+
+    def _discard_active_cloid(self, cloid: str) -> None:
+        """Remove a cloid from active_cloids and the per-quoter prefix index."""
+        self.active_cloids.discard(cloid)
+        prefix = _cloid_prefix(cloid)
+        cloids = self._active_cloids_by_prefix.get(prefix)
+        if cloids is not None:
+            cloids.discard(cloid)
+            if not cloids:
+                del self._active_cloids_by_prefix[prefix]
+
+    def _track_placed_order(
+        self,
+        cloid: str,
+        side: OrderSide,
+        price: Decimal,
+        size: Decimal,
+        order_id: Optional[int],
+    ) -> bool:
+        """
+        Move an order into the active tracking maps on ORDER_PLACED.
+
+        Counterpart of _cleanup_order_tracking: every container that makes up
+        the active_cloids / active_orders / order_sizes invariant is updated here,
+        so lifecycle transitions never touch the maps piecemeal.
+
+        Returns:
+            True if the order was pre-registered (now confirmed)
+        """
+        self._add_active_cloid(cloid)
+        # Store bidirectional mapping
+        if order_id is not None:
+            self.cloid_to_order_id[cloid] = order_id
+            self.order_id_to_cloid[order_id] = cloid
+
+        # Confirm pre-registration (if order was pre-registered)
+        was_preregistered = self._pop_preregistration(cloid) is not None
+
+        # Store initial size for fill calculation (if not already there from pre-reg)
+        self.order_sizes.setdefault(cloid, size)
+
+        # Add to active orders for inventory tracking (callback-based, no API!)
+        previous = self.active_orders.get(cloid)
+        if previous is not None:
+            self._unlock_order(previous)
+        info = OrderInfo(
+            cloid=cloid,
+            side=side,
+            price=price,
+            size=size,
+            order_id=order_id,
+        )
+        self.active_orders[cloid] = info
+        self._lock_order(info)
+        return was_preregistered
+
+    def _lock_order(self, info: OrderInfo) -> None:
+        """Add an active order's locked amount to the running totals."""
+        if info.side == OrderSide.BUY:
+            # Buy orders lock quote
+            self._locked_quote += info.size * info.price
+        else:
+            # Sell orders lock base
+            self._locked_base += info.size
+
+    def _unlock_order(self, info: OrderInfo) -> None:
+        """Remove an active order's locked amount from the running totals."""
+        if info.side == OrderSide.BUY:
+            self._locked_quote -= info.size * info.price
+        else:
+            self._locked_base -= info.size
 
     def _cleanup_order_tracking(
         self,
@@ -169,10 +424,12 @@ class Bot:
         mark_recently_cancelled: bool = False,
     ) -> None:
         """Clean all local tracking maps for a terminal order state."""
-        self.active_cloids.discard(cloid)
+        self._discard_active_cloid(cloid)
         self.order_sizes.pop(cloid, None)
-        self.preregistered_orders.pop(cloid, None)
-        self.active_orders.pop(cloid, None)
+        self._pop_preregistration(cloid)
+        info = self.active_orders.pop(cloid, None)
+        if info is not None:
+            self._unlock_order(info)
 
         if cloid in self.cloid_to_order_id:
             mapped_order_id = self.cloid_to_order_id.pop(cloid)
@@ -183,6 +440,56 @@ class Bot:
         if order_id is not None:
             self.order_id_to_cloid.pop(order_id, None)
 
+        # The id maps changed; drop the snapshot and any index built against them
+        self._invalidate_active_orders_cache()
+
+    async def _get_active_orders_cached(self, max_age: float = ACTIVE_ORDERS_CACHE_TTL) -> list:
+        """
+        Fetch active orders from the REST API, reusing a result younger than max_age.
+
+        Validation and the main loop both need on-chain orders on the same tick;
+        this avoids a duplicate RPC round trip. Concurrent callers share a single
+        in-flight request, and the blocking SDK call runs in a worker thread so
+        WebSocket callbacks keep flowing while it waits. Order-changing calls
+        invalidate the snapshot via _invalidate_active_orders_cache().
+        """
+        snapshot = self._active_orders_snapshot
+        if snapshot is not None and time.monotonic() - snapshot[0] < max_age:
+            return snapshot[1]
+
+        if self._active_orders_inflight is None:
+            self._active_orders_inflight = asyncio.ensure_future(self._fetch_active_orders())
+        # Shield so a cancelled caller doesn't cancel the fetch for everyone else
+        return await asyncio.shield(self._active_orders_inflight)
+
+    async def _fetch_active_orders(self) -> list:
+        """Run get_active_orders() in a worker thread and store the snapshot."""
+        generation = self._active_orders_generation
+        try:
+            fetched_at = time.monotonic()
+            orders = await asyncio.to_thread(self.client.user.get_active_orders)
+            if generation == self._active_orders_generation:
+                self._active_orders_snapshot = (fetched_at, orders)
+            return orders
+        finally:
+            # After an invalidation the slot was already detached and may hold a
+            # newer fetch; only clear it if it still belongs to this one
+            if generation == self._active_orders_generation:
+                self._active_orders_inflight = None
+
+    def _active_orders_snapshot_fresh(self, max_age: float) -> bool:
+        """True if _get_active_orders_cached(max_age) would return without an RPC."""
+        snapshot = self._active_orders_snapshot
+        return snapshot is not None and time.monotonic() - snapshot[0] < max_age
+
+    def _invalidate_active_orders_cache(self) -> None:
+        """Drop the cached active-orders snapshot after placing/cancelling orders or an order callback."""
+        self._active_orders_snapshot = None
+        self._active_orders_generation += 1
+        # A fetch already in flight may predate the change: later callers start
+        # their own instead of joining it (current awaiters still get its result)
+        self._active_orders_inflight = None
+
     def _handle_sdk_error(self, context: str, err: Exception) -> None:
         """Centralized SDK error classification and logging."""
         if isinstance(err, (KuruInsufficientFundsError, KuruContractError, KuruOrderError)):
@@ -215,289 +522,286 @@ class Bot:
         """
         # CRITICAL: Check if this is our order
         # The WebSocket may deliver callbacks for ALL market activity!
-        # We can identify our orders by checking if we've seen this cloid before
-        is_our_order = (
-            order.cloid in self.active_cloids or           # Currently active
-            order.cloid in self.order_sizes or              # We placed it
-            order.cloid in self.cloid_to_order_id or        # We tracked it
-            # Additional check: our cloids follow specific pattern (e.g., "bid-", "ask-")
-            (order.cloid and (order.cloid.startswith('bid-') or order.cloid.startswith('ask-')))
-        )
-
-        if not is_our_order:
-            # This is someone else's order - ignore it completely
-            logger.debug(f"Ignoring order callback for non-bot order: {order.cloid}")
+        # Built-in quoters emit "bid-"/"ask-" cloids, so the prefix check settles the
+        # common case; custom quoters may use other formats, which are still ours
+        # if we've seen the cloid before.
+        cloid = order.cloid
+        if cloid is None:
+            return
+        if cloid[:4] not in _OUR_PREFIXES and not (
+            cloid in self.active_cloids or           # Currently active
+            cloid in self.order_sizes or             # We placed it
+            cloid in self.cloid_to_order_id          # We tracked it
+        ):
+            # This is someone else's order - ignore it completely.
+            # No log here: this branch fires for every foreign order on the market,
+            # so even a filtered-out debug call costs an f-string + loguru dispatch.
             return
 
-        order_size = _to_decimal(order.size) if order.size is not None else Decimal("0")
-        order_price = _to_decimal(order.price) if order.price is not None else Decimal("0")
-
-        # Track order placement
-        if order.status == OrderStatus.ORDER_PLACED:
-            self.active_cloids.add(order.cloid)
-            # Store bidirectional mapping
-            if order.kuru_order_id is not None:
-                self.cloid_to_order_id[order.cloid] = order.kuru_order_id
-                self.order_id_to_cloid[order.kuru_order_id] = order.cloid
-
-            # Confirm pre-registration (if order was pre-registered)
-            if order.cloid in self.preregistered_orders:
-                del self.preregistered_orders[order.cloid]
-                self._debug_log(f"[ORDER] PLACED - {order.cloid} confirmed (was pre-registered)")
-
-            # Store initial size for fill calculation (if not already there from pre-reg)
-            if order.cloid not in self.order_sizes:
-                self.order_sizes[order.cloid] = order_size
-
-            # Add to active orders for inventory tracking (callback-based, no API!)
-            self.active_orders[order.cloid] = OrderInfo(
-                cloid=order.cloid,
-                side=order.side,
-                price=order_price,
-                size=order_size,
-                order_id=order.kuru_order_id
-            )
+        # Any lifecycle event on our orders makes the cached on-chain view stale
+        self._invalidate_active_orders_cache()
+
+        order_size = _to_decimal(order.size) if order.size is not None else _ZERO
+        order_price = _to_decimal(order.price) if order.price is not None else _ZERO
+
+        handler = self._status_handlers.get(order.status)
+        if handler is not None:
+            handler(order, order_size, order_price)
 
-            # Clear orphaned tracking if this order was previously detected as orphaned
-            if order.kuru_order_id in self.orphaned_order_timestamps:
-                self._debug_log(f"[ORDER] Order {order.kuru_order_id} callback arrived (was orphaned), clearing tracking")
-                del self.orphaned_order_timestamps[order.kuru_order_id]
+    def _on_order_placed(self, order: Order, order_size: Decimal, order_price: Decimal) -> None:
+        """ORDER_PLACED: move the order into active tracking."""
+        was_preregistered = self._track_placed_order(
+            order.cloid, order.side, order_price, order_size, order.kuru_order_id
+        )
+        if was_preregistered:
+            self._debug_logf("[ORDER] PLACED - {} confirmed (was pre-registered)", order.cloid)
+
+        # Clear orphaned tracking if this order was previously detected as orphaned
+        if self.orphaned_order_timestamps.pop(order.kuru_order_id, None) is not None:
+            self._debug_logf("[ORDER] Order {} callback arrived (was orphaned), clearing tracking", order.kuru_order_id)
 
-            # DEBUG: Log placement and current tracking state
+        # DEBUG: Log placement and current tracking state
+        if self._debug_enabled:
             self._debug_log(f"[ORDER] PLACED - {order.cloid} with size {float(order_size):.8f}")
             self._debug_log(f"[ORDER] Active orders tracked: {len(self.active_orders)}\n")
 
-            logger.debug(
-                f"✓ Order {order.cloid} placed on orderbook "
-                f"(ID: {order.kuru_order_id}, size: {float(order_size):.8f})"
-            )
+        logger.debug(
+            f"✓ Order {order.cloid} placed on orderbook "
+            f"(ID: {order.kuru_order_id}, size: {float(order_size):.8f})"
+        )
 
-            if self.influx:
-                side_str = "buy" if order.side == OrderSide.BUY else "sell"
-                self.influx.write_order(
-                    side=side_str,
-                    price=float(order_price),
-                    size=float(order_size),
-                    quoter_id=_extract_quoter_id(order.cloid),
-                    event="placed",
-                )
+        if self.influx:
+            side_str = "buy" if order.side == OrderSide.BUY else "sell"
+            self.influx.write_order(
+                side=side_str,
+                price=float(order_price),
+                size=float(order_size),
+                quoter_id=_extract_quoter_id(order.cloid),
+                event="placed",
+            )
 
-        # Track cancellations
-        elif order.status == OrderStatus.ORDER_CANCELLED:
-            # Capture price/size before cleanup clears active_orders
-            cancelled_order = self.active_orders.get(order.cloid)
-            self._cleanup_order_tracking(
-                order.cloid,
-                order.kuru_order_id,
-                mark_recently_cancelled=True,
+    def _on_order_cancelled(self, order: Order, order_size: Decimal, order_price: Decimal) -> None:
+        """ORDER_CANCELLED: drop tracking and remember the id to mask API lag."""
+        # Capture price/size before cleanup clears active_orders
+        cancelled_order = self.active_orders.get(order.cloid)
+        self._cleanup_order_tracking(
+            order.cloid,
+            order.kuru_order_id,
+            mark_recently_cancelled=True,
+        )
+        self._debug_logf("[INVENTORY] Removed cancelled order: {}", order.cloid)
+        logger.debug(f"✗ Order {order.cloid} cancelled")
+
+        if self.influx and cancelled_order:
+            side_str = "buy" if cancelled_order.side == OrderSide.BUY else "sell"
+            self.influx.write_order(
+                side=side_str,
+                price=float(cancelled_order.price),
+                size=float(cancelled_order.size),
+                quoter_id=_extract_quoter_id(order.cloid),
+                event="cancelled",
             )
-            self._debug_log(f"[INVENTORY] Removed cancelled order: {order.cloid}")
-            logger.debug(f"✗ Order {order.cloid} cancelled")
-
-            if self.influx and cancelled_order:
-                side_str = "buy" if cancelled_order.side == OrderSide.BUY else "sell"
-                self.influx.write_order(
-                    side=side_str,
-                    price=float(cancelled_order.price),
-                    size=float(cancelled_order.size),
-                    quoter_id=_extract_quoter_id(order.cloid),
-                    event="cancelled",
-                )
 
-        # Track fills and update position
-        elif order.status == OrderStatus.ORDER_FULLY_FILLED:
-            self._debug_log(f"[ORDER] FULLY_FILLED event - cloid: {order.cloid}")
-            self._debug_log(f"[ORDER]   side: {order.side.value if order.side else 'None'}")
+    def _on_order_fully_filled(self, order: Order, order_size: Decimal, order_price: Decimal) -> None:
+        """ORDER_FULLY_FILLED: apply the fill to the position and drop tracking."""
+        cloid = order.cloid
+        order_sizes = self.order_sizes
+        side_str = order.side.value if order.side else 'N/A'
+        if self._debug_enabled:
+            self._debug_log(f"[ORDER] FULLY_FILLED event - cloid: {cloid}")
+            self._debug_log(f"[ORDER]   side: {side_str}")
             self._debug_log(f"[ORDER]   remaining size: {float(order_size):.8f}")
             self._debug_log(f"[ORDER]   price: {float(order_price):.8f}")
 
-            # Calculate filled size - check both order_sizes and preregistered_orders
-            previous_size = None
-            source = None
-
-            if order.cloid in self.order_sizes:
-                # Normal path: ORDER_PLACED fired before fill (or immediate fill via PRESEND)
-                previous_size = self.order_sizes[order.cloid]
-                source = "order_sizes"
-                del self.order_sizes[order.cloid]
-                # If ORDER_PLACED never fired (immediate fill), preregistered_orders still has
-                # this cloid (both were set together at PRESEND). Clean it up now.
-                self.preregistered_orders.pop(order.cloid, None)
-            elif order.cloid in self.preregistered_orders:
-                # Immediate fill path: ORDER_PLACED never fired
-                previous_size = self.preregistered_orders[order.cloid][0]
-                source = "preregistered"
-                del self.preregistered_orders[order.cloid]
-
-            if previous_size is not None:
-                filled_size = previous_size - order_size  # order.size should be 0 for fully filled
-
+        # Calculate filled size - check both order_sizes and preregistered_orders
+        source = None
+        # Normal path: ORDER_PLACED fired before fill (or immediate fill via PRESEND)
+        previous_size = order_sizes.pop(cloid, None)
+        # If ORDER_PLACED never fired (immediate fill), preregistered_orders still has
+        # this cloid (both were set together at PRESEND). Clean it up now.
+        prereg = self._pop_preregistration(cloid)
+        if previous_size is not None:
+            source = "order_sizes"
+        elif prereg is not None:
+            # Immediate fill path: ORDER_PLACED never fired
+            previous_size = prereg.size
+            source = "preregistered"
+
+        if previous_size is not None:
+            filled_size = previous_size - order_size  # order.size should be 0 for fully filled
+
+            if self._debug_enabled:
                 self._debug_log(f"[ORDER]   previous size: {float(previous_size):.8f} (from {source})")
                 self._debug_log(f"[ORDER]   FILLED SIZE: {float(filled_size):.8f}")
 
-                # Update position tracker with actual filled amount
-                self.position_tracker.update_position(
-                    side=order.side,
-                    filled_size=filled_size,
-                    price=order_price
-                )
-
-                # SUCCESS
-                self._debug_log(f"[ORDER] Position tracker updated successfully\n")
-
-            else:
-                # FAILURE - not in either dict
-                self._debug_log(f"[ORDER] ⚠️ SKIPPED - Order not in order_sizes or preregistered!")
-                self._debug_log(f"[ORDER] Position NOT updated for {order.cloid}\n")
-                logger.error(
-                    f"⚠️ Fill received for unknown order: {order.cloid} "
-                    f"(side: {order.side.value if order.side else 'N/A'}, "
-                    f"size: {float(order_size):.8f}) - POSITION NOT UPDATED!"
-                )
+            # Update position tracker with actual filled amount
+            self.position_tracker.update_position(
+                side=order.side,
+                filled_size=filled_size,
+                price=order_price
+            )
 
-            self._cleanup_order_tracking(order.cloid, order.kuru_order_id)
-            self._debug_log(f"[INVENTORY] Removed filled order: {order.cloid}")
+            # SUCCESS
+            self._debug_log(f"[ORDER] Position tracker updated successfully\n")
 
-            logger.success(
-                f"✓ Order {order.cloid} filled! "
-                f"Side: {order.side.value if order.side else 'N/A'}, "
-                f"Price: {order.price}"
+        else:
+            # FAILURE - not in either dict
+            self._debug_log(f"[ORDER] ⚠️ SKIPPED - Order not in order_sizes or preregistered!")
+            self._debug_logf("[ORDER] Position NOT updated for {}\n", cloid)
+            logger.error(
+                f"⚠️ Fill received for unknown order: {cloid} "
+                f"(side: {side_str}, "
+                f"size: {float(order_size):.8f}) - POSITION NOT UPDATED!"
             )
 
-            if self.influx and previous_size is not None and order.side is not None:
-                oracle_price_raw = self.oracle_service.get_price(
-                    self.market_config.market_address, self.oracle_source
-                )
-                if oracle_price_raw is not None:
-                    oracle_f = float(oracle_price_raw)
-                    fill_f = float(order_price)
-                    size_f = float(filled_size)
-                    is_buy = order.side == OrderSide.BUY
-                    realized_edge_bps = (
-                        (oracle_f - fill_f) / oracle_f * 10000 if is_buy
-                        else (fill_f - oracle_f) / oracle_f * 10000
-                    )
-                    edge_pnl = size_f * (oracle_f - fill_f if is_buy else fill_f - oracle_f)
-                    self._cumulative_edge_pnl += edge_pnl
-                    qid = _extract_quoter_id(order.cloid)
-                    self._cumulative_edge_pnl_by_quoter[qid] = (
-                        self._cumulative_edge_pnl_by_quoter.get(qid, 0.0) + edge_pnl
-                    )
-                    self.influx.write_fill(
-                        side="buy" if is_buy else "sell",
-                        price=fill_f,
-                        oracle_price=oracle_f,
-                        realized_edge_bps=realized_edge_bps,
-                        edge_pnl=edge_pnl,
-                        filled_size=size_f,
-                        remaining_size=0.0,
-                        fill_type="full",
-                        quoter_id=_extract_quoter_id(order.cloid),
-                    )
+        self._cleanup_order_tracking(cloid, order.kuru_order_id)
+        self._debug_logf("[INVENTORY] Removed filled order: {}", cloid)
+
+        logger.success(
+            f"✓ Order {cloid} filled! "
+            f"Side: {side_str}, "
+            f"Price: {order.price}"
+        )
 
-        elif order.status == OrderStatus.ORDER_PARTIALLY_FILLED:
-            self._debug_log(f"[ORDER] PARTIALLY_FILLED event - cloid: {order.cloid}")
-            self._debug_log(f"[ORDER]   side: {order.side.value if order.side else 'None'}")
+        if previous_size is not None:
+            self._record_fill_edge(order, order_price, filled_size, _ZERO, "full")
+
+    def _on_order_partially_filled(self, order: Order, order_size: Decimal, order_price: Decimal) -> None:
+        """ORDER_PARTIALLY_FILLED: apply the fill and keep the order tracked at its remaining size."""
+        cloid = order.cloid
+        order_sizes = self.order_sizes
+        side_str = order.side.value if order.side else 'N/A'
+        if self._debug_enabled:
+            self._debug_log(f"[ORDER] PARTIALLY_FILLED event - cloid: {cloid}")
+            self._debug_log(f"[ORDER]   side: {side_str}")
             self._debug_log(f"[ORDER]   remaining size: {float(order_size):.8f}")
             self._debug_log(f"[ORDER]   price: {float(order_price):.8f}")
 
-            # Calculate filled size - check both order_sizes and preregistered_orders
-            previous_size = None
-            source = None
-
-            if order.cloid in self.order_sizes:
-                previous_size = self.order_sizes[order.cloid]
-                source = "order_sizes"
-            elif order.cloid in self.preregistered_orders:
-                previous_size = self.preregistered_orders[order.cloid][0]
+        # Calculate filled size - check both order_sizes and preregistered_orders
+        source = None
+        previous_size = order_sizes.get(cloid)
+        if previous_size is not None:
+            source = "order_sizes"
+        else:
+            prereg = self._pop_preregistration(cloid)
+            if prereg is not None:
+                previous_size = prereg.size
                 source = "preregistered"
                 # Move to order_sizes since it's confirmed now
-                self.order_sizes[order.cloid] = order_size
-                del self.preregistered_orders[order.cloid]
+                order_sizes[cloid] = order_size
 
-            if previous_size is not None:
-                filled_size = previous_size - order_size
+        if previous_size is not None:
+            filled_size = previous_size - order_size
 
+            if self._debug_enabled:
                 self._debug_log(f"[ORDER]   previous size: {float(previous_size):.8f} (from {source})")
                 self._debug_log(f"[ORDER]   FILLED SIZE: {float(filled_size):.8f}")
 
-                # Update position tracker with actual filled amount
-                self.position_tracker.update_position(
-                    side=order.side,
-                    filled_size=filled_size,
-                    price=order_price
-                )
+            # Update position tracker with actual filled amount
+            self.position_tracker.update_position(
+                side=order.side,
+                filled_size=filled_size,
+                price=order_price
+            )
 
-                # Update stored size for next partial fill
-                self.order_sizes[order.cloid] = order_size
+            # Update stored size for next partial fill
+            order_sizes[cloid] = order_size
 
-                # Update size in active_orders (still on book, but with less remaining)
-                if order.cloid in self.active_orders:
-                    self.active_orders[order.cloid].size = order_size
+            # Update size in active_orders (still on book, but with less remaining)
+            active = self.active_orders.get(cloid)
+            if active is not None:
+                self._unlock_order(active)
+                active.size = order_size
+                self._lock_order(active)
+                if self._debug_enabled:
                     self._debug_log(
-                        f"[INVENTORY] Updated order size: {order.cloid}, "
+                        f"[INVENTORY] Updated order size: {cloid}, "
                         f"remaining={float(order_size):.8f}"
                     )
 
-                # SUCCESS
-                self._debug_log(f"[ORDER] Position tracker updated successfully\n")
-
-            else:
-                # FAILURE
-                self._debug_log(f"[ORDER] ⚠️ SKIPPED - Order not in order_sizes or preregistered!")
-                self._debug_log(f"[ORDER] Position NOT updated for {order.cloid}\n")
-                logger.error(
-                    f"⚠️ Partial fill received for unknown order: {order.cloid} "
-                    f"(side: {order.side.value if order.side else 'N/A'}, "
-                    f"remaining: {float(order_size):.8f}) - POSITION NOT UPDATED!"
-                )
-
-            # Keep in active_cloids since it's still on the book
-            logger.info(f"⚡ Order {order.cloid} partially filled")
+            # SUCCESS
+            self._debug_log(f"[ORDER] Position tracker updated successfully\n")
 
-            if self.influx and previous_size is not None and order.side is not None:
-                oracle_price_raw = self.oracle_service.get_price(
-                    self.market_config.market_address, self.oracle_source
-                )
-                if oracle_price_raw is not None:
-                    oracle_f = float(oracle_price_raw)
-                    fill_f = float(order_price)
-                    size_f = float(filled_size)
-                    is_buy = order.side == OrderSide.BUY
-                    realized_edge_bps = (
-                        (oracle_f - fill_f) / oracle_f * 10000 if is_buy
-                        else (fill_f - oracle_f) / oracle_f * 10000
-                    )
-                    edge_pnl = size_f * (oracle_f - fill_f if is_buy else fill_f - oracle_f)
-                    self._cumulative_edge_pnl += edge_pnl
-                    qid = _extract_quoter_id(order.cloid)
-                    self._cumulative_edge_pnl_by_quoter[qid] = (
-                        self._cumulative_edge_pnl_by_quoter.get(qid, 0.0) + edge_pnl
-                    )
-                    self.influx.write_fill(
-                        side="buy" if is_buy else "sell",
-                        price=fill_f,
-                        oracle_price=oracle_f,
-                        realized_edge_bps=realized_edge_bps,
-                        edge_pnl=edge_pnl,
-                        filled_size=size_f,
-                        remaining_size=float(order_size),
-                        fill_type="partial",
-                        quoter_id=_extract_quoter_id(order.cloid),
-                    )
-        elif order.status == OrderStatus.ORDER_TIMEOUT:
-            self._cleanup_order_tracking(order.cloid, order.kuru_order_id)
-            logger.warning(
-                f"⏱️ Order timeout: cloid={order.cloid}, kuru_order_id={order.kuru_order_id}, "
-                f"txhash={order.txhash}"
-            )
-        elif order.status == OrderStatus.ORDER_FAILED:
-            self._cleanup_order_tracking(order.cloid, order.kuru_order_id)
+        else:
+            # FAILURE
+            self._debug_log(f"[ORDER] ⚠️ SKIPPED - Order not in order_sizes or preregistered!")
+            self._debug_logf("[ORDER] Position NOT updated for {}\n", cloid)
             logger.error(
-                f"✗ Order failed: cloid={order.cloid}, kuru_order_id={order.kuru_order_id}, "
-                f"txhash={order.txhash}"
+                f"⚠️ Partial fill received for unknown order: {cloid} "
+                f"(side: {side_str}, "
+                f"remaining: {float(order_size):.8f}) - POSITION NOT UPDATED!"
             )
 
+        # Keep in active_cloids since it's still on the book
+        logger.info(f"⚡ Order {cloid} partially filled")
+
+        if previous_size is not None:
+            self._record_fill_edge(order, order_price, filled_size, order_size, "partial")
+
+    def _on_order_timeout(self, order: Order, order_size: Decimal, order_price: Decimal) -> None:
+        """ORDER_TIMEOUT: the transaction never landed; drop tracking."""
+        self._cleanup_order_tracking(order.cloid, order.kuru_order_id)
+        logger.warning(
+            f"⏱️ Order timeout: cloid={order.cloid}, kuru_order_id={order.kuru_order_id}, "
+            f"txhash={order.txhash}"
+        )
+
+    def _on_order_failed(self, order: Order, order_size: Decimal, order_price: Decimal) -> None:
+        """ORDER_FAILED: the transaction reverted; drop tracking."""
+        self._cleanup_order_tracking(order.cloid, order.kuru_order_id)
+        logger.error(
+            f"✗ Order failed: cloid={order.cloid}, kuru_order_id={order.kuru_order_id}, "
+            f"txhash={order.txhash}"
+        )
+
+    def _get_oracle_price(self) -> Optional[float]:
+        """Latest reference price for this market from the configured oracle source."""
+        return self._price_source.get_price(self._market_address)
+
+    async def _get_oracle_price_async(self) -> Optional[float]:
+        """_get_oracle_price for the main loop: HTTP-backed sources refresh off the loop."""
+        return await self._price_source.get_price_async(self._market_address)
+
+    def _record_fill_edge(
+        self,
+        order: Order,
+        order_price: Decimal,
+        filled_size: Decimal,
+        remaining_size: Decimal,
+        fill_type: str,
+    ) -> None:
+        """Accumulate realized edge PnL for a fill and write it to InfluxDB."""
+        if not self.influx or order.side is None:
+            return
+        oracle_price_raw = self._get_oracle_price()
+        if oracle_price_raw is None:
+            return
+        oracle_f = float(oracle_price_raw)
+        fill_f = float(order_price)
+        size_f = float(filled_size)
+        is_buy = order.side == OrderSide.BUY
+        realized_edge_bps = (
+            (oracle_f - fill_f) / oracle_f * 10000 if is_buy
+            else (fill_f - oracle_f) / oracle_f * 10000
+        )
+        edge_pnl = size_f * (oracle_f - fill_f if is_buy else fill_f - oracle_f)
+        self._cumulative_edge_pnl += edge_pnl
+        qid = _extract_quoter_id(order.cloid)
+        self._cumulative_edge_pnl_by_quoter[qid] = (
+            self._cumulative_edge_pnl_by_quoter.get(qid, 0.0) + edge_pnl
+        )
+        self.influx.write_fill(
+            side="buy" if is_buy else "sell",
+            price=fill_f,
+            oracle_price=oracle_f,
+            realized_edge_bps=realized_edge_bps,
+            edge_pnl=edge_pnl,
+            filled_size=size_f,
+            remaining_size=float(remaining_size),
+            fill_type=fill_type,
+            quoter_id=qid,
+        )
+
     async def start(self) -> None:
         """
         Start the bot: create client, setup callbacks, and run main loop.
@@ -519,7 +823,7 @@ class Bot:
         # Start price feed based on configured oracle
         if self.oracle_source == "kuru":
             logger.info("Connecting to Kuru orderbook WebSocket...")
-            self.kuru_price_source.start(self.bot_config.kuru_symbol)
+            await self.kuru_price_source.start(self.bot_config.kuru_symbol)
         else:
             logger.info(f"Using Coinbase API as oracle (symbol: {self.bot_config.coinbase_symbol})")
 
@@ -563,9 +867,15 @@ class Bot:
         # Start config watcher (if bot_config.toml exists)
         config_path = Path("bot_config.toml")
         if config_path.exists():
-            self.config_watcher = ConfigWatcher(config_path, self._on_config_reload)
+            watcher_conf = parse_toml_cached(config_path).get("watcher", {})
+            self.config_watcher = ConfigWatcher(
+                config_path,
+                self._on_config_reload,
+                poll_interval=float(watcher_conf.get("poll_interval", 5.0)),
+                debounce=float(watcher_conf.get("debounce", 0.5)),
+            )
             await self.config_watcher.start()
-            logger.info("🔄 Hot-reload enabled: checking for config changes every 5s")
+            logger.info("🔄 Hot-reload enabled")
         else:
             logger.info("Hot-reload disabled: bot_config.toml not found")
 
@@ -580,14 +890,13 @@ class Bot:
         """
         try:
             # Try to load saved state first
-            from pathlib import Path
-            state_file = Path("tracking") / "position_state.json"
+            state_file = _tracking_dir() / "position_state.json"
             saved_state = PositionTracker.load_state(state_file)
 
             if self.bot_config.override_start_position is not None:
                 # Config override takes precedence
                 starting_position = _to_decimal(self.bot_config.override_start_position)
-                quote_position = Decimal("0")
+                quote_position = _ZERO
                 self._debug_log(f"[INIT] Using CONFIG OVERRIDE starting position: {float(starting_position):.6f}")
                 logger.info(
                     f"Using override starting position: {float(starting_position):.6f} "
@@ -605,13 +914,15 @@ class Bot:
                 )
             else:
                 # Default to 0 for neutral market-making strategy
-                starting_position = Decimal("0")
-                quote_position = Decimal("0")
+                starting_position = _ZERO
+                quote_position = _ZERO
                 self._debug_log(f"[INIT] No saved state - defaulting to position: 0.0 (neutral strategy)")
                 logger.info("Starting position set to 0 (neutral strategy - tracks net buys/sells)")
 
             # Initialize position tracker
-            self.position_tracker = PositionTracker(starting_position=starting_position)
+            self.position_tracker = PositionTracker(
+                starting_position=starting_position, debug_enabled=self._debug_enabled
+            )
 
             # Restore quote position if loaded
             if saved_state and self.bot_config.override_start_position is None:
@@ -625,11 +936,11 @@ class Bot:
             )
 
         except Exception as e:
-            logger.error(f"Failed to initialize position tracker: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Failed to initialize position tracker: {e}")
             logger.warning("Falling back to starting_position=0.0")
-            self.position_tracker = PositionTracker(starting_position=Decimal("0"))
+            self.position_tracker = PositionTracker(
+                starting_position=_ZERO, debug_enabled=self._debug_enabled
+            )
 
     def _initialize_quoters(self) -> None:
         """
@@ -660,40 +971,48 @@ class Bot:
             quoter_type = self.bot_config.quoter_type
             quoter_cls = get_quoter_class(quoter_type)
 
+            # Quantity and skew params are shared by every level; resolve them once
+            if self.bot_config.quantity_bps_per_level is not None:
+                quantity = (self.bot_config.max_position * self.bot_config.quantity_bps_per_level) / 10000
+                logger.info(
+                    f"Quoters: Using quantity_bps={self.bot_config.quantity_bps_per_level} "
+                    f"→ quantity={quantity:.2f}"
+                )
+            else:
+                quantity = self.bot_config.quantity
+                logger.info(f"Quoters: Using fixed quantity={quantity}")
+
+            shared_conf = {
+                "quantity": quantity,
+                "prop_skew_entry": self.bot_config.prop_skew_entry,
+                "prop_skew_exit": self.bot_config.prop_skew_exit,
+            }
             for baseline_edge_bps in self.bot_config.quoters_bps:
-                # Calculate quantity
-                if self.bot_config.quantity_bps_per_level is not None:
-                    quantity = (self.bot_config.max_position * self.bot_config.quantity_bps_per_level) / 10000
-                    logger.info(
-                        f"Quoter {baseline_edge_bps}bps: Using quantity_bps={self.bot_config.quantity_bps_per_level} "
-                        f"→ quantity={quantity:.2f}"
-                    )
-                else:
-                    quantity = self.bot_config.quantity
-                    logger.info(f"Quoter {baseline_edge_bps}bps: Using fixed quantity={quantity}")
-
-                # Build config section for from_config
-                q_conf = {
-                    "baseline_edge_bps": baseline_edge_bps,
-                    "quantity": quantity,
-                    "prop_skew_entry": self.bot_config.prop_skew_entry,
-                    "prop_skew_exit": self.bot_config.prop_skew_exit,
-                }
-                quoter = quoter_cls.from_config(q_conf)
+                quoter = quoter_cls.from_config({**shared_conf, "baseline_edge_bps": baseline_edge_bps})
                 self.quoters.append(quoter)
 
         logger.success(f"✓ Initialized {len(self.quoters)} quoters")
 
     def get_locked_inventory(self) -> tuple[Decimal, Decimal]:
         """
-        Calculate locked inventory from callback-tracked orders.
+        Locked inventory from callback-tracked orders, maintained incrementally.
         No API call needed!
 
         Returns:
             (locked_base, locked_quote)
         """
-        locked_base = Decimal("0")
-        locked_quote = Decimal("0")
+        return self._locked_base, self._locked_quote
+
+    def _compute_locked_inventory(self) -> tuple[Decimal, Decimal]:
+        """
+        Recompute locked inventory by scanning active_orders.
+        Used to cross-check the running totals during reconciliation.
+
+        Returns:
+            (locked_base, locked_quote)
+        """
+        locked_base = _ZERO
+        locked_quote = _ZERO
 
         for order_info in self.active_orders.values():
             if order_info.side == OrderSide.BUY:
@@ -714,17 +1033,26 @@ class Bot:
             block_number: Block number to reconcile at (None = latest)
         """
         try:
-            # Get current block if not specified
+            # Get margin balances, fetching the current block alongside if not specified
             if block_number is None:
-                block_number = await self.client.user.w3.eth.block_number
+                block_number, (base_wei, quote_wei) = await asyncio.gather(
+                    self.client.user.w3.eth.block_number,
+                    self.client.user.get_margin_balances(),
+                )
+            else:
+                base_wei, quote_wei = await self.client.user.get_margin_balances()
 
-            # Get margin balances
-            base_wei, quote_wei = await self.client.user.get_margin_balances()
+            base_balance = Decimal(base_wei) / self._base_scale
+            quote_balance = Decimal(quote_wei) / self._quote_scale
 
-            base_balance = Decimal(base_wei) / Decimal(10 ** self.market_config.base_token_decimals)
-            quote_balance = Decimal(quote_wei) / Decimal(10 ** self.market_config.quote_token_decimals)
+            # Snapshot the oracle price once, alongside the balances, for the
+            # trace and the CSV row
+            current_price = self._get_oracle_price()
 
-            self._debug_log(f"[RECONCILE] ===== RECONCILIATION @ block {block_number} =====")
+            self._debug_logf(
+                "[RECONCILE] ===== RECONCILIATION @ block {} (oracle price: {}) =====",
+                block_number, current_price,
+            )
             self._debug_log(
                 f"[RECONCILE] Margin balances - base: {float(base_balance):.6f}, "
                 f"quote: {float(quote_balance):.6f}"
@@ -732,14 +1060,26 @@ class Bot:
 
             # Calculate locked inventory from callback-tracked orders (NO API CALL!)
             locked_base, locked_quote = self.get_locked_inventory()
+            if self._debug_enabled:
+                # Cross-check the running totals against a full scan
+                scanned_base, scanned_quote = self._compute_locked_inventory()
+                if (scanned_base, scanned_quote) != (locked_base, locked_quote):
+                    logger.warning(
+                        f"⚠️ Locked inventory totals drifted: running=({float(locked_base):.6f}, "
+                        f"{float(locked_quote):.6f}), scanned=({float(scanned_base):.6f}, "
+                        f"{float(scanned_quote):.6f}). Resyncing."
+                    )
+                    self._locked_base, self._locked_quote = scanned_base, scanned_quote
+                    locked_base, locked_quote = scanned_base, scanned_quote
 
-            self._debug_log(f"[RECONCILE] Tracked active orders: {len(self.active_orders)}")
-            for i, order_info in enumerate(self.active_orders.values()):
-                side_str = "BUY" if order_info.side == OrderSide.BUY else "SELL"
-                self._debug_log(
-                    f"[RECONCILE] Order {i}: {side_str} "
-                    f"{float(order_info.size):.2f} @ {float(order_info.price):.6f}"
-                )
+            self._debug_logf("[RECONCILE] Tracked active orders: {}", len(self.active_orders))
+            if self._debug_verbose_reconcile:
+                for i, order_info in enumerate(self.active_orders.values()):
+                    side_str = "BUY" if order_info.side == OrderSide.BUY else "SELL"
+                    self._debug_log(
+                        f"[RECONCILE] Order {i}: {side_str} "
+                        f"{float(order_info.size):.2f} @ {float(order_info.price):.6f}"
+                    )
 
             self._debug_log(
                 f"[RECONCILE] Locked (from callbacks) - base: {float(locked_base):.6f}, "
@@ -774,27 +1114,28 @@ class Bot:
 
             # Track drift over time and alert on changes
             previous_drift = getattr(self, '_last_reconcile_drift', None)
-            drift_delta = Decimal("0")
+            drift_delta = _ZERO
 
             if previous_drift is not None:
                 drift_delta = drift - previous_drift
 
                 # Alert if drift changes by >10 tokens (indicates missing fills or external transactions)
                 if abs(drift_delta) > Decimal("10"):
-                    self._debug_log(
-                        f"[RECONCILE] ⚠️ DRIFT CHANGE DETECTED: {float(drift_delta):+.2f} tokens"
-                    )
-                    self._debug_log(f"[RECONCILE]   Previous drift: {float(previous_drift):.6f}")
-                    self._debug_log(f"[RECONCILE]   Current drift: {float(drift):.6f}")
-                    self._debug_log(
-                        f"[RECONCILE]   total_base: {float(total_base):.6f}, "
-                        f"tracked_position: {float(tracked_position):.6f}"
-                    )
+                    if self._debug_enabled:
+                        self._debug_log(
+                            f"[RECONCILE] ⚠️ DRIFT CHANGE DETECTED: {float(drift_delta):+.2f} tokens"
+                        )
+                        self._debug_log(f"[RECONCILE]   Previous drift: {float(previous_drift):.6f}")
+                        self._debug_log(f"[RECONCILE]   Current drift: {float(drift):.6f}")
+                        self._debug_log(
+                            f"[RECONCILE]   total_base: {float(total_base):.6f}, "
+                            f"tracked_position: {float(tracked_position):.6f}"
+                        )
                     logger.warning(
                         f"⚠️ Drift changed by {float(drift_delta):+.2f} tokens - "
                         f"likely missing fill events or external transactions"
                     )
-                else:
+                elif self._debug_verbose_reconcile:
                     # Tracking is working correctly
                     self._debug_log(
                         f"[RECONCILE] ✓ Drift stable: {float(drift_delta):+.2f} tokens (tracking OK)"
@@ -821,46 +1162,25 @@ class Bot:
 
             self._debug_log(f"[RECONCILE] ===== END RECONCILIATION =====\n")
 
-            # Write to CSV
-            tracking_dir = Path("tracking")
-            tracking_dir.mkdir(exist_ok=True)
-            csv_path = tracking_dir / "position_reconciliation.csv"
-
-            # Check if file exists to write header
-            write_header = not csv_path.exists()
-
-            with open(csv_path, 'a', newline='') as f:
-                writer = csv.writer(f)
-
-                if write_header:
-                    writer.writerow([
-                        'timestamp', 'block_number',
-                        'margin_base', 'locked_base', 'free_base', 'total_base_owned',
-                        'margin_quote', 'locked_quote', 'free_quote', 'total_quote_owned',
-                        'tracked_position', 'drift',
-                        'num_active_orders', 'current_price'
-                    ])
-
-                current_price = self.oracle_service.get_price(
-                    self.market_config.market_address, self.oracle_source
-                )
-
-                writer.writerow([
-                    datetime.now().isoformat(),
-                    block_number,
-                    f"{float(base_balance):.6f}",
-                    f"{float(locked_base):.6f}",
-                    f"{float(free_base):.6f}",
-                    f"{float(total_base):.6f}",
-                    f"{float(quote_balance):.6f}",
-                    f"{float(locked_quote):.6f}",
-                    f"{float(free_quote):.6f}",
-                    f"{float(total_quote):.6f}",
-                    f"{float(tracked_position):.6f}",
-                    f"{float(drift):.6f}",
-                    len(self.active_orders),
-                    f"{current_price:.8f}" if current_price else "None"
-                ])
+            # Write to CSV (file I/O runs in the default executor, off the event loop)
+            row = [
+                datetime.now().isoformat(),
+                block_number,
+                f"{float(base_balance):.6f}",
+                f"{float(locked_base):.6f}",
+                f"{float(free_base):.6f}",
+                f"{float(total_base):.6f}",
+                f"{float(quote_balance):.6f}",
+                f"{float(locked_quote):.6f}",
+                f"{float(free_quote):.6f}",
+                f"{float(total_quote):.6f}",
+                f"{float(tracked_position):.6f}",
+                f"{float(drift):.6f}",
+                len(self.active_orders),
+                f"{current_price:.8f}" if current_price else "None"
+            ]
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._append_reconcile_row, row)
 
             # Periodic API validation (every 10th reconciliation)
             await self._validate_against_api()
@@ -889,9 +1209,36 @@ class Bot:
             )
 
         except Exception as e:
-            logger.error(f"Failed to reconcile position: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Failed to reconcile position: {e}")
+
+    def _get_reconcile_writer(self):
+        """
+        Return the persistent reconciliation CSV writer, opening the file on first use.
+
+        The header is written only if the file is empty, checked once via fstat
+        on the open handle rather than a path stat per reconciliation.
+        """
+        if self._reconcile_csv_writer is None:
+            csv_path = _tracking_dir() / "position_reconciliation.csv"
+
+            fh = open(csv_path, 'a', newline='')
+            writer = csv.writer(fh)
+            if os.fstat(fh.fileno()).st_size == 0:
+                writer.writerow([
+                    'timestamp', 'block_number',
+                    'margin_base', 'locked_base', 'free_base', 'total_base_owned',
+                    'margin_quote', 'locked_quote', 'free_quote', 'total_quote_owned',
+                    'tracked_position', 'drift',
+                    'num_active_orders', 'current_price'
+                ])
+            self._reconcile_csv_fh = fh
+            self._reconcile_csv_writer = writer
+        return self._reconcile_csv_writer
+
+    def _append_reconcile_row(self, row: list) -> None:
+        """Append one row to the reconciliation CSV (blocking; run in an executor)."""
+        self._get_reconcile_writer().writerow(row)
+        self._reconcile_csv_fh.flush()
 
     async def _validate_against_api(self) -> None:
         """
@@ -910,22 +1257,40 @@ class Bot:
 
             # Fetch actual active orders from API
             try:
-                api_active_orders = self.client.user.get_active_orders()
+                api_active_orders = await self._get_active_orders_cached()
             except KuruAuthorizationError as e:
                 self._handle_sdk_error("Validation skipped", e)
                 return
+            # Callbacks for our orders may have run while the fetch was awaited. Every
+            # one invalidates the cached snapshot, so the API list is only known to be
+            # consistent with the tracking maps if it is still the cached snapshot.
+            snapshot = self._active_orders_snapshot
+            snapshot_consistent = snapshot is not None and snapshot[1] is api_active_orders
 
             # QUICK CHECK (every time): Detect orphaned orders
             # This is critical for detecting lost callbacks quickly
-            api_order_ids = {int(order.get('orderid')) for order in api_active_orders if order.get('orderid') is not None}
-
-            # Check both active_orders (confirmed) and cloid mappings (order placed)
-            tracked_order_ids = {
-                info.order_id for info in self.active_orders.values() if info.order_id is not None
-            }
-            tracked_order_ids.update(self.cloid_to_order_id.values())
-
-            missing_in_tracked = api_order_ids - tracked_order_ids
+            # Quick pre-filter in the same pass: any id in order_id_to_cloid is one we
+            # placed. Only the remainder (normally empty) needs the full tracked-id set,
+            # which the every-10th full validation also needs for phantom detection.
+            order_id_to_cloid = self.order_id_to_cloid
+            api_order_ids = set()
+            missing_in_tracked = set()
+            for order in api_active_orders:
+                raw_id = order.get('orderid')
+                if raw_id is None:
+                    continue
+                oid = int(raw_id)
+                api_order_ids.add(oid)
+                if oid not in order_id_to_cloid:
+                    missing_in_tracked.add(oid)
+            full_validation = self._validation_counter % 10 == 0
+            if missing_in_tracked or full_validation:
+                # Check both active_orders (confirmed) and cloid mappings (order placed)
+                tracked_order_ids = {
+                    info.order_id for info in self.active_orders.values() if info.order_id is not None
+                }
+                tracked_order_ids.update(self.cloid_to_order_id.values())
+                missing_in_tracked -= tracked_order_ids
 
             current_time = time.monotonic()
             orphan_timeout = 3.0  # seconds - grace period for late callbacks
@@ -939,37 +1304,34 @@ class Bot:
             missing_in_tracked -= self.recently_cancelled_order_ids.keys()
 
             if missing_in_tracked:
-                # Track when we first saw these orphaned orders
+                # Track when we first saw these orphaned orders and check the
+                # grace period in the same pass (new orphans have age 0)
+                old_orphans = []
+                max_age = 0.0
                 for order_id in missing_in_tracked:
-                    if order_id not in self.orphaned_order_timestamps:
+                    first_seen = self.orphaned_order_timestamps.get(order_id)
+                    if first_seen is None:
                         # First time seeing this orphaned order
                         self.orphaned_order_timestamps[order_id] = current_time
                         logger.warning(
                             f"⚠️ Orphaned order detected: {order_id} on chain but no callback yet. "
                             f"Waiting {orphan_timeout}s for late callback..."
                         )
-                        self._debug_log(f"[VALIDATE] New orphaned order: {order_id}, starting grace period")
-                    else:
-                        # Already tracking this orphan
-                        time_orphaned = current_time - self.orphaned_order_timestamps[order_id]
-                        self._debug_log(
-                            f"[VALIDATE] Still orphaned: {order_id}, age={time_orphaned:.1f}s "
-                            f"(timeout at {orphan_timeout}s)"
-                        )
-
-                # Check if any orphaned orders have exceeded grace period
-                old_orphans = []
-                for order_id in missing_in_tracked:
-                    time_orphaned = current_time - self.orphaned_order_timestamps.get(order_id, current_time)
+                        continue
+                    time_orphaned = current_time - first_seen
+                    if time_orphaned > max_age:
+                        max_age = time_orphaned
                     if time_orphaned > orphan_timeout:
                         old_orphans.append(order_id)
-                        self._debug_log(f"[VALIDATE] Orphan {order_id} exceeded timeout: {time_orphaned:.1f}s > {orphan_timeout}s")
 
-                self._debug_log(
-                    f"[VALIDATE] Orphan summary: {len(missing_in_tracked)} total orphans, "
-                    f"{len(old_orphans)} exceeded timeout, "
-                    f"{len(missing_in_tracked) - len(old_orphans)} still in grace period"
-                )
+                # One aggregated trace line instead of one per orphan
+                if self._debug_enabled:
+                    self._debug_log(
+                        f"[VALIDATE] Orphan summary: {len(missing_in_tracked)} total orphans, "
+                        f"{len(old_orphans)} exceeded timeout ({orphan_timeout}s), "
+                        f"{len(missing_in_tracked) - len(old_orphans)} still in grace period, "
+                        f"oldest={max_age:.1f}s"
+                    )
 
                 if old_orphans:
                     # Orphaned orders exceeded grace period - callbacks were lost
@@ -992,13 +1354,7 @@ class Bot:
                     await asyncio.sleep(3.0)
 
                     # Clear all tracking state (safe now that orders are cancelled and callbacks processed)
-                    self.active_orders.clear()
-                    self.order_sizes.clear()
-                    self.preregistered_orders.clear()
-                    self.active_cloids.clear()
-                    self.cloid_to_order_id.clear()
-                    self.order_id_to_cloid.clear()
-                    self.orphaned_order_timestamps.clear()
+                    self._reset_order_tracking()
 
                     logger.success("✓ State reset complete. All orders cancelled, tracking cleared. Resuming trading.")
                     self._debug_log(f"[VALIDATE] State cleared, ready for fresh start")
@@ -1010,7 +1366,7 @@ class Bot:
                     self.orphaned_order_timestamps.clear()
 
             # FULL VALIDATION (every 10th reconciliation): Detailed comparison
-            if self._validation_counter % 10 != 0:
+            if not full_validation:
                 return
 
             self._debug_log(f"[VALIDATE] ===== FULL API VALIDATION =====")
@@ -1028,14 +1384,40 @@ class Bot:
             # Check for phantom orders (tracked but not on chain)
             missing_in_api = tracked_order_ids - api_order_ids
 
-            if missing_in_api:
-                logger.warning(f"⚠️ Orders tracked but not on chain: {missing_in_api}")
-                self._debug_log(f"[VALIDATE] Missing in API (phantom orders): {missing_in_api}")
-                for cloid, info in list(self.active_orders.items()):
-                    if info.order_id in missing_in_api:
-                        logger.warning(f"Cleaning up phantom order: {cloid}")
-                        del self.active_orders[cloid]
-                        self._debug_log(f"[VALIDATE] Cleaned up phantom: {cloid}")
+            if missing_in_api and not snapshot_consistent:
+                # An order confirmed after the fetch started would look like a phantom;
+                # leave it for the next full validation instead of dropping live state
+                self._debug_logf(
+                    "[VALIDATE] Tracking changed during fetch, deferring phantom check for {}",
+                    missing_in_api,
+                )
+            elif missing_in_api:
+                # A just-confirmed order can be missing only because the REST list
+                # lags chain state; clean up only what was already missing last time
+                phantom_ids = missing_in_api & self._phantom_suspect_ids
+                self._phantom_suspect_ids = missing_in_api - phantom_ids
+                if self._phantom_suspect_ids:
+                    self._debug_logf(
+                        "[VALIDATE] Missing in API, rechecking next full validation: {}",
+                        self._phantom_suspect_ids,
+                    )
+                if phantom_ids:
+                    logger.warning(f"⚠️ Orders tracked but not on chain: {phantom_ids}")
+                    self._debug_log(f"[VALIDATE] Missing in API (phantom orders): {phantom_ids}")
+                # Resolve each phantom directly through the id map instead of
+                # scanning every active order
+                for order_id in phantom_ids:
+                    cloid = self.order_id_to_cloid.get(order_id)
+                    if cloid is None:
+                        continue
+                    logger.warning(f"Cleaning up phantom order: {cloid}")
+                    # Clear every map, not just active_orders, so the cloid can't
+                    # linger in active_cloids as an "unknown" order forever
+                    self._cleanup_order_tracking(cloid, order_id)
+                    self._debug_logf("[VALIDATE] Cleaned up phantom: {}", cloid)
+
+            else:
+                self._phantom_suspect_ids.clear()
 
             if tracked_count == api_count and not missing_in_api:
                 self._debug_log(f"[VALIDATE] ✓ All orders match (full validation)!")
@@ -1043,35 +1425,37 @@ class Bot:
             self._debug_log(f"[VALIDATE] ===== END FULL VALIDATION =====")
 
         except Exception as e:
-            logger.error(f"Failed to validate against API: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Failed to validate against API: {e}")
 
     async def _cleanup_stale_preregistrations(self) -> None:
         """
         Clean up pre-registered orders that never received confirmation.
         Call this periodically (e.g., every 30 seconds).
+
+        preregistered_orders is insertion-ordered and entries are stamped with
+        time.monotonic(), which never goes backwards. The sweep therefore walks
+        from the oldest entry and stops at the first one still inside the
+        timeout: O(stale) rather than O(all).
         """
         try:
-            current_time = time.time()
+            current_time = time.monotonic()
             stale_timeout = 5  # seconds (short timeout since transactions are fast)
 
             stale_cloids = []
-            for cloid, (_, timestamp) in self.preregistered_orders.items():
-                age = current_time - timestamp
-                if age > stale_timeout:
-                    stale_cloids.append(cloid)
+            for cloid, prereg in self.preregistered_orders.items():
+                if current_time - prereg.timestamp <= stale_timeout:
+                    break
+                stale_cloids.append(cloid)
 
             for cloid in stale_cloids:
                 # Remove from order_sizes (order never confirmed)
-                if cloid in self.order_sizes:
-                    del self.order_sizes[cloid]
-                del self.preregistered_orders[cloid]
+                self.order_sizes.pop(cloid, None)
+                self._pop_preregistration(cloid)
                 logger.warning(
                     f"⚠️ Cleaned up stale pre-registration for {cloid} "
                     f"(no confirmation after {stale_timeout}s)"
                 )
-                self._debug_log(f"[CLEANUP] Removed stale pre-registration: {cloid}")
+                self._debug_logf("[CLEANUP] Removed stale pre-registration: {}", cloid)
 
         except Exception as e:
             logger.error(f"Failed to cleanup stale pre-registrations: {e}")
@@ -1082,15 +1466,18 @@ class Bot:
         This is a one-time cleanup at startup to ensure clean slate.
         """
         try:
-            active_orders = self.client.user.get_active_orders()
+            active_orders = await self._get_active_orders_cached(max_age=ACTIVE_ORDERS_CACHE_TTL)
             if active_orders:
                 before_count = len(active_orders)
                 logger.info(
                     f"Found {before_count} existing orders from previous run, "
                     "running startup cancel sweep..."
                 )
+                self._invalidate_active_orders_cache()
                 await self.client.cancel_all_active_orders_for_market()
-                remaining_orders = self.client.user.get_active_orders()
+                # A fetch started while the cancel was in flight predates it
+                self._invalidate_active_orders_cache()
+                remaining_orders = await self._get_active_orders_cached(max_age=0)
                 remaining_count = len(remaining_orders)
                 cancelled_count = max(before_count - remaining_count, 0)
                 logger.success(
@@ -1109,9 +1496,24 @@ class Bot:
         ) as e:
             self._handle_sdk_error("Failed to cancel existing orders", e)
         except Exception as e:
-            logger.error(f"Failed to cancel existing orders: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Failed to cancel existing orders: {e}")
+
+    async def _wait_for_shutdown(self, timeout: float) -> bool:
+        """
+        Sleep up to timeout seconds, waking early if shutdown is requested.
+
+        Reuses one shutdown_event.wait() task across calls instead of letting
+        asyncio.wait_for wrap a fresh coroutine in a new task every iteration.
+
+        Returns:
+            True if shutdown was requested
+        """
+        if self.shutdown_event.is_set():
+            return True
+        if self._shutdown_waiter is None:
+            self._shutdown_waiter = asyncio.ensure_future(self.shutdown_event.wait())
+        done, _ = await asyncio.wait({self._shutdown_waiter}, timeout=timeout)
+        return bool(done)
 
     async def run_main_loop(self) -> None:
         """
@@ -1119,8 +1521,10 @@ class Bot:
         """
         logger.info("🚀 Starting market making loop...\n")
         iteration = 0
-        self.last_reconcile_time = time.time()
-        self.last_cleanup_time = time.time()
+        # Interval timers use the monotonic clock so wall-clock jumps (NTP) can't
+        # stall or burst reconciliation/cleanup
+        self.last_reconcile_time = time.monotonic()
+        self.last_cleanup_time = time.monotonic()
 
         while not self.shutdown_event.is_set():
             try:
@@ -1129,71 +1533,108 @@ class Bot:
                 # Skip trading activities during reinitialization
                 if self.is_reinitializing:
                     logger.debug("Reinitialization in progress, skipping iteration")
-                    await asyncio.sleep(1.0)
+                    await self._wait_for_shutdown(1.0)
                     continue
 
+                # One clock read drives both periodic-task checks; intervals are
+                # measured start-to-start from this iteration's timestamp
+                now = time.monotonic()
+
                 # Periodic reconciliation
                 if self.bot_config.reconcile_interval > 0:
-                    if time.time() - self.last_reconcile_time >= self.bot_config.reconcile_interval:
+                    if now - self.last_reconcile_time >= self.bot_config.reconcile_interval:
                         await self._reconcile_position()
-                        self.last_reconcile_time = time.time()
+                        self.last_reconcile_time = now
 
                 # Periodic cleanup of stale pre-registrations (every 5 seconds)
                 cleanup_interval = 5.0
-                if time.time() - self.last_cleanup_time >= cleanup_interval:
+                if now - self.last_cleanup_time >= cleanup_interval:
                     await self._cleanup_stale_preregistrations()
-                    self.last_cleanup_time = time.time()
+                    self.last_cleanup_time = now
 
                 # Get reference price from configured oracle
-                reference_price_raw = self.oracle_service.get_price(
-                    self.market_config.market_address,
-                    self.oracle_source
-                )
+                reference_price_raw = await self._get_oracle_price_async()
 
                 if reference_price_raw is None:
                     logger.warning("Could not fetch reference price, skipping iteration")
-                    await asyncio.sleep(1.0)
+                    await self._wait_for_shutdown(1.0)
                     continue
 
                 reference_price = _to_decimal(reference_price_raw)
                 logger.info(f"Iteration {iteration}: Price=${float(reference_price):.5f}")
 
-                # Get current on-chain active orders
-                on_chain_orders = self.client.user.get_active_orders()
-
-                # Delegate to quoters to decide what to cancel and place
-                all_orders, num_cancels, num_new_orders = self._generate_orders(
-                    reference_price, on_chain_orders
-                )
+                # Get current on-chain active orders. The snapshot is dropped by every
+                # callback and place_orders call, so while nothing changes it is reused
+                # for up to ACTIVE_ORDERS_QUIET_TTL instead of hitting the API each tick.
+                #
+                # A stale snapshot means our orders changed (fill/cancel/placement), which
+                # is when the quoters usually re-quote, so overlap the margin-balance RPC
+                # with the orders RPC. On quiet ticks balances are only fetched if needed.
+                #
+                # With ORDERS_FROM_CALLBACKS the quoters work purely off the callback-
+                # maintained active_orders mirror and the API list is only consulted by
+                # reconciliation (_validate_against_api).
+                balances_task = None
+                if not self._orders_from_callbacks and not self._active_orders_snapshot_fresh(ACTIVE_ORDERS_QUIET_TTL):
+                    balances_task = asyncio.ensure_future(self.client.user.get_margin_balances())
+                try:
+                    if self._orders_from_callbacks:
+                        on_chain_by_cloid: Dict[str, OrderInfo] = {}
+                        cancel_refund_view = self.active_orders
+                    else:
+                        on_chain_orders = await self._get_active_orders_cached(max_age=ACTIVE_ORDERS_QUIET_TTL)
+                        # Parse once; quoting and balance filtering both read the normalized view
+                        on_chain_by_cloid = self._index_on_chain_orders(on_chain_orders)
+                        cancel_refund_view = on_chain_by_cloid
+
+                    # Delegate to quoters to decide what to cancel and place
+                    all_orders, num_cancels, num_new_orders = self._generate_orders(
+                        reference_price, on_chain_by_cloid
+                    )
 
-                logger.info(f"Quoters: {num_cancels} cancels, {num_new_orders} new orders")
+                    logger.info(f"Quoters: {num_cancels} cancels, {num_new_orders} new orders")
 
-                # Validate balance before placing orders
-                if all_orders:
-                    all_orders = await self._filter_orders_by_balance(all_orders, on_chain_orders)
+                    # Validate balance before placing orders
+                    if all_orders:
+                        all_orders = await self._filter_orders_by_balance(
+                            all_orders, cancel_refund_view, balances_task
+                        )
+                finally:
+                    # Nothing to place (or an error above): drop the prefetch, and
+                    # mark a finished one's error as retrieved so asyncio doesn't warn
+                    if balances_task is not None:
+                        if not balances_task.done():
+                            balances_task.cancel()
+                        elif not balances_task.cancelled():
+                            balances_task.exception()
 
                 if all_orders:
-                    # Debug: Check orders before sending
-                    logger.info(f"Order details before sending:")
-                    for order in all_orders:
-                        order_type_str = "CANCEL" if order.order_type == OrderType.CANCEL else "LIMIT"
-                        logger.info(
-                            f"  {order.cloid}: type={order_type_str}, side={order.side}, "
-                            f"price={order.price}, size={order.size}"
-                        )
+                    # Debug: Check orders before sending (one log record for the whole batch)
+                    # Lazy: the per-order lines are only built if an INFO sink is active
+                    logger.opt(lazy=True).info(
+                        "Order details before sending:\n{}",
+                        lambda: "\n".join(
+                            f"  {order.cloid}: "
+                            f"type={'CANCEL' if order.order_type == OrderType.CANCEL else 'LIMIT'}, "
+                            f"side={order.side}, price={order.price}, size={order.size}"
+                            for order in all_orders
+                        ),
+                    )
 
                     # PRE-REGISTER new orders BEFORE sending (handles immediate fills)
                     presend_cloids = []
+                    presend_time = time.monotonic()
+                    preregister = self._preregister_order
                     for order in all_orders:
                         if order.order_type == OrderType.LIMIT and order.size is not None:
                             # Skip cancels, only pre-register new limit orders
-                            order_size = _to_decimal(order.size)
-                            self.preregistered_orders[order.cloid] = (order_size, time.time())
-                            self.order_sizes[order.cloid] = order_size
-                            presend_cloids.append(order.cloid)
-                            self._debug_log(f"[PRESEND] Pre-registered {order.cloid} with size {order.size}")
+                            cloid = order.cloid
+                            preregister(cloid, _to_decimal(order.size), presend_time)
+                            presend_cloids.append(cloid)
+                            self._debug_logf("[PRESEND] Pre-registered {} with size {}", order.cloid, order.size)
 
                     # Single transaction for cancel + place
+                    self._invalidate_active_orders_cache()
                     try:
                         txhash = await self.client.place_orders(
                             all_orders,
@@ -1213,10 +1654,10 @@ class Bot:
                         KuruTransactionError,
                     ) as e:
                         for cloid in presend_cloids:
-                            self.preregistered_orders.pop(cloid, None)
+                            self._pop_preregistration(cloid)
                             self.order_sizes.pop(cloid, None)
                         self._handle_sdk_error("Order placement failed", e)
-                        await asyncio.sleep(1.0)
+                        await self._wait_for_shutdown(1.0)
                         continue
 
                     # Print PnL
@@ -1227,8 +1668,9 @@ class Bot:
                 # Write iteration metrics to InfluxDB
                 if self.influx:
                     current_position = self.position_tracker.get_current_position()
-                    stop_bids = current_position > self.bot_config.max_position
-                    stop_asks = current_position < -self.bot_config.max_position
+                    max_position = self.bot_config.max_position
+                    stop_bids = current_position > max_position
+                    stop_asks = current_position < -max_position
 
                     # Compute TPS
                     now = time.monotonic()
@@ -1239,14 +1681,15 @@ class Bot:
 
                     # Build order price snapshot
                     order_prices: dict = {}
-                    bids = sorted(
-                        [o for o in self.active_orders.values() if o.side == OrderSide.BUY],
-                        key=lambda o: o.price, reverse=True,
-                    )
-                    asks = sorted(
-                        [o for o in self.active_orders.values() if o.side == OrderSide.SELL],
-                        key=lambda o: o.price,
-                    )
+                    bids = []
+                    asks = []
+                    for o in self.active_orders.values():
+                        if o.side == OrderSide.BUY:
+                            bids.append(o)
+                        elif o.side == OrderSide.SELL:
+                            asks.append(o)
+                    bids.sort(key=lambda o: o.price, reverse=True)
+                    asks.sort(key=lambda o: o.price)
                     for i, o in enumerate(bids):
                         order_prices[f"bid_{i}"] = float(o.price)
                     for i, o in enumerate(asks):
@@ -1273,11 +1716,11 @@ class Bot:
                     )
 
                 # Sleep 1 second
-                try:
-                    await asyncio.wait_for(self.shutdown_event.wait(), timeout=1.0)
+                self._flush_debug_log()
+                if self.position_tracker:
+                    self.position_tracker.flush()
+                if await self._wait_for_shutdown(1.0):
                     break
-                except asyncio.TimeoutError:
-                    pass
 
             except (
                 KuruInsufficientFundsError,
@@ -1290,15 +1733,52 @@ class Bot:
                 KuruTransactionError,
             ) as e:
                 self._handle_sdk_error("Error in main loop", e)
-                await asyncio.sleep(1.0)
+                await self._wait_for_shutdown(1.0)
             except Exception as e:
                 logger.error(f"Error in main loop: {e}")
-                await asyncio.sleep(1.0)
+                await self._wait_for_shutdown(1.0)
+
+    def _index_on_chain_orders(self, on_chain_orders: list) -> Dict[str, OrderInfo]:
+        """
+        Parse raw API orders once into OrderInfo keyed by cloid (our orders only).
+
+        Args:
+            on_chain_orders: List of active order dicts from get_active_orders()
+
+        Returns:
+            Dict of cloid -> OrderInfo with price/size already scaled to human units
+
+        A snapshot reused across quiet ticks is parsed only once: the index is kept
+        until the list changes or the cache generation moves (any order callback or
+        tracking cleanup, i.e. anything that can change order_id_to_cloid).
+        """
+        cached = self._on_chain_index
+        if cached is not None and cached[0] is on_chain_orders and cached[1] == self._active_orders_generation:
+            return cached[2]
+
+        size_precision = self._size_precision
+        price_precision = self._price_precision
+        order_id_to_cloid = self.order_id_to_cloid
+        on_chain_by_cloid: Dict[str, OrderInfo] = {}
+        for order in on_chain_orders:
+            order_id = int(order.get('orderid', 0))
+            cloid = order_id_to_cloid.get(order_id)
+            if cloid is None:
+                continue
+            on_chain_by_cloid[cloid] = OrderInfo(
+                cloid=cloid,
+                side=OrderSide.BUY if order.get("isbuy", False) else OrderSide.SELL,
+                price=_to_decimal(order.get('price', 0)) / price_precision,
+                size=_to_decimal(order.get('size', 0)) / size_precision,
+                order_id=order_id,
+            )
+        self._on_chain_index = (on_chain_orders, self._active_orders_generation, on_chain_by_cloid)
+        return on_chain_by_cloid
 
     def _resolve_order_price(
         self,
         cloid: str,
-        on_chain_by_cloid: dict,
+        on_chain_by_cloid: Dict[str, OrderInfo],
     ) -> tuple[Optional[Decimal], str]:
         """
         Resolve the price and source of an existing order from tracking dicts.
@@ -1308,21 +1788,20 @@ class Bot:
         Returns:
             (price_or_none, source_string)
         """
-        if cloid in on_chain_by_cloid:
-            order = on_chain_by_cloid[cloid]
-            price = _to_decimal(order.get('price', 0)) / Decimal(self.market_config.price_precision)
-            return price, "on_chain"
+        on_chain = on_chain_by_cloid.get(cloid)
+        if on_chain is not None:
+            return on_chain.price, "on_chain"
         elif cloid in self.preregistered_orders:
             return None, "preregistered"
-        elif cloid in self.active_orders:
-            return self.active_orders[cloid].price, "callback"
-        else:
-            return None, "unknown"
+        active = self.active_orders.get(cloid)
+        if active is not None:
+            return active.price, "callback"
+        return None, "unknown"
 
     def _resolve_existing_orders(
         self,
         quoter: BaseQuoter,
-        on_chain_by_cloid: dict,
+        on_chain_by_cloid: Dict[str, OrderInfo],
     ) -> tuple[Optional[ExistingOrder], Optional[ExistingOrder]]:
         """
         Find and resolve this quoter's existing bid and ask orders
@@ -1334,33 +1813,37 @@ class Bot:
         existing_bid = None
         existing_ask = None
 
-        # Primary: search active_cloids (callback-driven, no RPC lag)
-        for cloid in list(self.active_cloids):
-            if cloid.startswith(quoter.cloid_prefix_bid):
-                price, source = self._resolve_order_price(cloid, on_chain_by_cloid)
-                existing_bid = ExistingOrder(cloid=cloid, side=OrderSide.BUY, price=price, source=source)
-            elif cloid.startswith(quoter.cloid_prefix_ask):
-                price, source = self._resolve_order_price(cloid, on_chain_by_cloid)
-                existing_ask = ExistingOrder(cloid=cloid, side=OrderSide.SELL, price=price, source=source)
-
-        # Fallback: order just sent but ORDER_PLACED callback not yet received
-        if existing_bid is None:
-            for cloid in self.preregistered_orders:
-                if cloid.startswith(quoter.cloid_prefix_bid):
+        # Primary: active_cloids via the prefix index (callback-driven, no RPC lag)
+        bid_cloids = self._active_cloids_by_prefix.get(quoter.cloid_prefix_bid)
+        if bid_cloids:
+            cloid = next(iter(bid_cloids))
+            price, source = self._resolve_order_price(cloid, on_chain_by_cloid)
+            existing_bid = ExistingOrder(cloid=cloid, side=OrderSide.BUY, price=price, source=source)
+        ask_cloids = self._active_cloids_by_prefix.get(quoter.cloid_prefix_ask)
+        if ask_cloids:
+            cloid = next(iter(ask_cloids))
+            price, source = self._resolve_order_price(cloid, on_chain_by_cloid)
+            existing_ask = ExistingOrder(cloid=cloid, side=OrderSide.SELL, price=price, source=source)
+
+        # Fallback: order just sent but ORDER_PLACED callback not yet received.
+        # Usually nothing is pending, so skip the lookups entirely in that case.
+        prereg_by_prefix = self._prereg_by_prefix
+        if prereg_by_prefix:
+            if existing_bid is None:
+                cloid = next(iter(prereg_by_prefix.get(quoter.cloid_prefix_bid, ())), None)
+                if cloid is not None:
                     existing_bid = ExistingOrder(cloid=cloid, side=OrderSide.BUY, price=None, source="preregistered")
-                    break
-        if existing_ask is None:
-            for cloid in self.preregistered_orders:
-                if cloid.startswith(quoter.cloid_prefix_ask):
+            if existing_ask is None:
+                cloid = next(iter(prereg_by_prefix.get(quoter.cloid_prefix_ask, ())), None)
+                if cloid is not None:
                     existing_ask = ExistingOrder(cloid=cloid, side=OrderSide.SELL, price=None, source="preregistered")
-                    break
 
         return existing_bid, existing_ask
 
     def _generate_orders(
         self,
         reference_price: Decimal,
-        on_chain_orders: list,
+        on_chain_by_cloid: Dict[str, OrderInfo],
     ) -> tuple[list[Order], int, int]:
         """
         Generate orders by delegating to each quoter's decide() method.
@@ -1370,7 +1853,7 @@ class Bot:
 
         Args:
             reference_price: Current fair/reference price
-            on_chain_orders: List of active orders from API
+            on_chain_by_cloid: Our active on-chain orders, from _index_on_chain_orders()
 
         Returns:
             tuple: (all_orders, num_cancels, num_new_orders)
@@ -1385,17 +1868,22 @@ class Bot:
         stop_asks = current_position < -self.bot_config.max_position
 
         if stop_bids:
-            logger.debug(f"Position {float(current_position):.2f} > MAX_POSITION {float(self.bot_config.max_position):.2f} - STOPPING BID QUOTES")
+            logger.debug(
+                "Position {:.2f} > MAX_POSITION {:.2f} - STOPPING BID QUOTES",
+                current_position, self.bot_config.max_position,
+            )
         if stop_asks:
-            logger.debug(f"Position {float(current_position):.2f} < -MAX_POSITION {float(-self.bot_config.max_position):.2f} - STOPPING ASK QUOTES")
+            logger.debug(
+                "Position {:.2f} < -MAX_POSITION {:.2f} - STOPPING ASK QUOTES",
+                current_position, -self.bot_config.max_position,
+            )
 
-        # Build map of on-chain orders by cloid (for our orders only)
-        on_chain_by_cloid = {}
-        for order in on_chain_orders:
-            order_id = int(order.get('orderid', 0))
-            if order_id in self.order_id_to_cloid:
-                cloid = self.order_id_to_cloid[order_id]
-                on_chain_by_cloid[cloid] = order
+        # Loop-invariant context fields, converted once for all quoters
+        max_position = _to_decimal(self.bot_config.max_position)
+        prop_maintain = self.bot_config.prop_maintain
+        price_precision = self._price_precision
+        cancel_type = OrderType.CANCEL
+        discard_active_cloid = self._discard_active_cloid
 
         for quoter in self.quoters:
             # Resolve existing orders for this quoter from tracking dicts
@@ -1405,25 +1893,27 @@ class Bot:
             ctx = QuoterContext(
                 reference_price=reference_price,
                 current_position=current_position,
-                max_position=_to_decimal(self.bot_config.max_position),
+                max_position=max_position,
                 existing_bid=existing_bid,
                 existing_ask=existing_ask,
                 stop_bids=stop_bids,
                 stop_asks=stop_asks,
-                prop_maintain=self.bot_config.prop_maintain,
-                price_precision=Decimal(self.market_config.price_precision),
+                prop_maintain=prop_maintain,
+                price_precision=price_precision,
             )
 
             # Let the quoter decide what to cancel and place
             decision = quoter.decide(ctx)
 
             # Process cancels
-            for cloid in decision.cancels:
-                all_orders.append(Order(cloid=cloid, order_type=OrderType.CANCEL))
+            cancels = decision.cancels
+            if cancels:
+                all_orders.extend([Order(cloid=cloid, order_type=cancel_type) for cloid in cancels])
                 # Proactively remove from active_cloids so the next iteration doesn't
                 # find this stale cloid and mistakenly think the slot is still filled.
-                self.active_cloids.discard(cloid)
-                total_cancels += 1
+                for cloid in cancels:
+                    discard_active_cloid(cloid)
+                total_cancels += len(cancels)
 
             # Collect new orders
             all_orders.extend(decision.new_orders)
@@ -1431,81 +1921,83 @@ class Bot:
 
         return all_orders, total_cancels, total_new_orders
 
-    async def _filter_orders_by_balance(self, orders: list[Order], on_chain_orders: list) -> list[Order]:
+    async def _filter_orders_by_balance(
+        self,
+        orders: list[Order],
+        on_chain_by_cloid: Dict[str, OrderInfo],
+        balances_task: Optional[asyncio.Future] = None,
+    ) -> list[Order]:
         """
         Filter orders to only include those we have sufficient balance for.
 
         Args:
             orders: List of orders (cancels + new orders)
-            on_chain_orders: Current on-chain orders
+            on_chain_by_cloid: Our active on-chain orders, from _index_on_chain_orders()
+            balances_task: Optional in-flight get_margin_balances() started by the
+                main loop; fetched here if not provided
 
         Returns:
             Filtered list of orders we can afford
         """
-        # Get current margin balances
-        base_wei, quote_wei = await self.client.user.get_margin_balances()
-        base_balance = Decimal(base_wei) / Decimal(10 ** self.market_config.base_token_decimals)
-        quote_balance = Decimal(quote_wei) / Decimal(10 ** self.market_config.quote_token_decimals)
-
-        # Margin balance IS the free balance - tokens in margin are fully available.
-        # Existing orders have already been deducted from margin when they were placed.
-        free_base = base_balance
-        free_quote = quote_balance
-
-        logger.debug(f"Margin balance (free): base={float(free_base):.2f}, quote={float(free_quote):.2f}")
-
-        # Build cloid lookup for cancels
-        on_chain_by_cloid = {}
-        for order in on_chain_orders:
-            order_id = int(order.get('orderid', 0))
-            if order_id in self.order_id_to_cloid:
-                cloid = self.order_id_to_cloid[order_id]
-                on_chain_by_cloid[cloid] = order
-
-        # Separate cancels and new orders
-        cancels = [o for o in orders if o.order_type == OrderType.CANCEL]
-        new_orders = [o for o in orders if o.order_type == OrderType.LIMIT]
-
-        # Cancels return tokens to margin - add them to available balance
-        for cancel_order in cancels:
-            if cancel_order.cloid in on_chain_by_cloid:
-                order = on_chain_by_cloid[cancel_order.cloid]
-                is_buy = order.get("isbuy", False)
-                size = _to_decimal(order.get("size", 0)) / Decimal(self.market_config.size_precision)
-                price = _to_decimal(order.get("price", 0)) / Decimal(self.market_config.price_precision)
-
-                if is_buy:
-                    free_quote += size * price
-                    logger.debug(
-                        f"Cancel {cancel_order.cloid} returns {float(size * price):.2f} quote to margin"
-                    )
+        # Single pass over the batch: cancels return tokens to margin (credited to the
+        # available balance below), new orders accumulate their required balance
+        cancels = []
+        buy_orders = []
+        sell_orders = []
+        returned_base = _ZERO
+        returned_quote = _ZERO
+        required_base = _ZERO
+        required_quote = _ZERO
+
+        for o in orders:
+            order_type = o.order_type
+            if order_type == OrderType.CANCEL:
+                cancels.append(o)
+                order = on_chain_by_cloid.get(o.cloid)
+                if order is None:
+                    continue
+                if order.side == OrderSide.BUY:
+                    notional = order.size * order.price
+                    returned_quote += notional
+                    logger.debug("Cancel {} returns {:.2f} quote to margin", o.cloid, notional)
                 else:
-                    free_base += size
-                    logger.debug(f"Cancel {cancel_order.cloid} returns {float(size):.2f} base to margin")
+                    returned_base += order.size
+                    logger.debug("Cancel {} returns {:.2f} base to margin", o.cloid, order.size)
+            elif order_type == OrderType.LIMIT:
+                if o.side == OrderSide.BUY:
+                    if o.size is None or o.price is None:
+                        logger.warning(f"Skipping malformed buy order {o.cloid}: missing size/price")
+                        continue
+                    buy_orders.append(o)
+                    required_quote += _to_decimal(o.size) * _to_decimal(o.price)
+                elif o.side == OrderSide.SELL:
+                    if o.size is None:
+                        logger.warning(f"Skipping malformed sell order {o.cloid}: missing size")
+                        continue
+                    sell_orders.append(o)
+                    required_base += _to_decimal(o.size)
 
-        logger.debug(f"Available after cancels: base={float(free_base):.2f}, quote={float(free_quote):.2f}")
+        # Cancel-only batch: nothing to check against balances, skip the RPC
+        if not buy_orders and not sell_orders:
+            logger.debug("No new orders to fund, skipping balance check")
+            return cancels
 
-        # Calculate required balances for new orders
-        required_base = Decimal("0")
-        required_quote = Decimal("0")
-        buy_orders = []
-        sell_orders = []
+        # Get current margin balances
+        if balances_task is not None:
+            base_wei, quote_wei = await balances_task
+        else:
+            base_wei, quote_wei = await self.client.user.get_margin_balances()
+        base_balance = Decimal(base_wei) / self._base_scale
+        quote_balance = Decimal(quote_wei) / self._quote_scale
 
-        for order in new_orders:
-            if order.side == OrderSide.BUY:
-                if order.size is None or order.price is None:
-                    logger.warning(f"Skipping malformed buy order {order.cloid}: missing size/price")
-                    continue
-                buy_orders.append(order)
-                required_quote += _to_decimal(order.size) * _to_decimal(order.price)
-            elif order.side == OrderSide.SELL:
-                if order.size is None:
-                    logger.warning(f"Skipping malformed sell order {order.cloid}: missing size")
-                    continue
-                sell_orders.append(order)
-                required_base += _to_decimal(order.size)
+        # Margin balance IS the free balance - tokens in margin are fully available.
+        # Existing orders have already been deducted from margin when they were placed.
+        logger.debug("Margin balance (free): base={:.2f}, quote={:.2f}", base_balance, quote_balance)
+        free_base = base_balance + returned_base
+        free_quote = quote_balance + returned_quote
 
-        logger.debug(f"New orders require: base={float(required_base):.2f}, quote={float(required_quote):.2f}")
+        logger.debug("Available after cancels: base={:.2f}, quote={:.2f}", free_base, free_quote)
+        logger.debug("New orders require: base={:.2f}, quote={:.2f}", required_base, required_quote)
 
         # Filter orders based on available balance
         filtered_orders = list(cancels)  # Always include cancels
@@ -1515,7 +2007,7 @@ class Bot:
         # Add buy orders only if we have enough quote balance
         if required_quote <= free_quote:
             filtered_orders.extend(buy_orders)
-            logger.debug(f"✓ All {len(buy_orders)} buy orders can be placed")
+            logger.debug("✓ All {} buy orders can be placed", len(buy_orders))
         else:
             skipped_buys = len(buy_orders)
             logger.warning(
@@ -1527,7 +2019,7 @@ class Bot:
         # Add sell orders only if we have enough base balance
         if required_base <= free_base:
             filtered_orders.extend(sell_orders)
-            logger.debug(f"✓ All {len(sell_orders)} sell orders can be placed")
+            logger.debug("✓ All {} sell orders can be placed", len(sell_orders))
         else:
             skipped_sells = len(sell_orders)
             logger.warning(
@@ -1564,7 +2056,8 @@ class Bot:
 
             while True:
                 try:
-                    active_orders = self.client.user.get_active_orders()
+                    # Reuses the post-sweep snapshot from the previous attempt when fresh
+                    active_orders = await self._get_active_orders_cached(max_age=ACTIVE_ORDERS_CACHE_TTL)
                 except (
                     KuruAuthorizationError,
                     KuruConnectionError,
@@ -1587,8 +2080,11 @@ class Bot:
 
                 try:
                     before_count = len(active_orders)
+                    self._invalidate_active_orders_cache()
                     await self.client.cancel_all_active_orders_for_market()
-                    remaining_count = len(self.client.user.get_active_orders())
+                    # A fetch started while the cancel was in flight predates it
+                    self._invalidate_active_orders_cache()
+                    remaining_count = len(await self._get_active_orders_cached(max_age=0))
                     cancelled_count = max(before_count - remaining_count, 0)
                     logger.success(
                         f"✓ Cancel sweep complete "
@@ -1611,9 +2107,7 @@ class Bot:
                 delay = min(delay * 2, max_delay)  # Exponential backoff with cap
 
         except Exception as e:
-            logger.error(f"Error during order cancellation: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error during order cancellation: {e}")
             return False
 
     def _on_config_reload(self, new_config: BotConfig):
@@ -1654,8 +2148,12 @@ class Bot:
             old_prop = self.bot_config.prop_maintain
             old_reconcile = self.bot_config.reconcile_interval
 
-            self.bot_config.prop_maintain = new_config.prop_maintain
-            self.bot_config.reconcile_interval = new_config.reconcile_interval
+            # BotConfig is frozen: swap in a copy carrying the hot-reloadable fields
+            self.bot_config = dataclasses.replace(
+                self.bot_config,
+                prop_maintain=new_config.prop_maintain,
+                reconcile_interval=new_config.reconcile_interval,
+            )
 
             if old_prop != new_config.prop_maintain:
                 logger.success(f"✓ Config reloaded: prop_maintain={new_config.prop_maintain} (was {old_prop})")
@@ -1739,9 +2237,7 @@ class Bot:
             logger.success("▶️  Trading resumed")
 
         except Exception as e:
-            logger.error(f"Failed to reinitialize quoters: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"Failed to reinitialize quoters: {e}")
             self.is_reinitializing = False  # Always resume trading on error
 
     async def stop(self) -> None:
@@ -1750,6 +2246,9 @@ class Bot:
         """
         logger.info("\n🛑 Stopping bot...")
 
+        if self._shutdown_waiter is not None and not self._shutdown_waiter.done():
+            self._shutdown_waiter.cancel()
+
         # Flush and stop InfluxDB writer before anything else
         if self.influx:
             await self.influx.stop()
@@ -1761,6 +2260,7 @@ class Bot:
         if hasattr(self, 'position_tracker') and self.position_tracker:
             try:
                 self.position_tracker.save_state()
+                self.position_tracker.close()
                 total_pos = self.position_tracker.get_current_position()
                 logger.info(f"💾 Position state saved: {float(total_pos):.2f}")
             except Exception as e:
@@ -1774,7 +2274,7 @@ class Bot:
         # Stop Kuru WebSocket
         if hasattr(self, 'kuru_price_source') and self.kuru_price_source:
             try:
-                self.kuru_price_source.stop()
+                await self.kuru_price_source.stop()
                 logger.success("✓ Kuru WebSocket stopped")
             except Exception as e:
                 logger.error(f"Failed to stop Kuru WebSocket: {e}")
@@ -1783,3 +2283,14 @@ class Bot:
         if self.client:
             await self.client.stop()
             logger.success("✓ Client stopped")
+
+        if self._reconcile_csv_fh is not None:
+            self._reconcile_csv_fh.close()
+            self._reconcile_csv_fh = None
+            self._reconcile_csv_writer = None
+
+        # Close the debug trace last so shutdown-time lines are kept
+        if self._debug_fh is not None:
+            self._flush_debug_log()
+            self._debug_fh.close()
+            self._debug_fh = None
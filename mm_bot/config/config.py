@@ -14,15 +14,21 @@ from mm_bot.kuru_imports import ConfigManager
 
 SDKConfigs = dict[str, Any]
 
+# Parsed TOML keyed by path: (fingerprint, raw bytes, parsed dict). A lookup by
+# (st_size, st_mtime_ns) fingerprint hits only for entries read from disk here;
+# caller-supplied bytes are matched on content, since mtime can't be trusted there.
+_TOML_CACHE: dict[Path, tuple[Optional[tuple[int, int]], bytes, dict]] = {}
+_TOML_CACHE_MAX_ENTRIES = 8
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class BotConfig:
     """Configuration for the market making bot"""
     max_position: float
     prop_skew_entry: float
     prop_skew_exit: float
     quantity: float
-    quoters_bps: List[float]
+    quoters_bps: tuple[float, ...]
     prop_maintain: float  # Cancel threshold factor (0.2 = keep orders with edge >= 80% of target)
     quantity_bps_per_level: Optional[float] = None  # If set, overrides quantity
     override_start_position: Optional[float] = None  # Manual position override
@@ -31,11 +37,42 @@ class BotConfig:
     coinbase_symbol: Optional[str] = None  # Required when oracle_source="coinbase"
     kuru_symbol: Optional[str] = None  # Required when oracle_source="kuru" (e.g. "mon_ausd")
     kuru_depth_state: str = "committed"  # "proposed"|"voted"|"finalized"|"committed"
+    kuru_max_book_age: float = 30.0  # Seconds without a Kuru book update before the price is treated as unavailable
     market_address: Optional[str] = None  # Market address (restart required to change)
     quoter_type: str = "skew"  # Default quoter type for flat config (used with quoters_bps)
     quoters_config: Optional[List[dict]] = None  # Per-quoter config for mixed types ([[strategy.quoters]])
 
 
+# .env only fills variables that aren't already set, so reading it once per
+# process is equivalent to re-reading it on every config load
+_dotenv_loaded = False
+
+
+def load_dotenv_once() -> None:
+    """Read .env into the environment on first use only."""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+# Numeric BotConfig fields read by load_config_from_env: (field, env var, default)
+_ENV_FLOAT_FIELDS = (
+    ("max_position", "MAX_POSITION", "1000"),
+    ("prop_skew_entry", "PROP_SKEW_ENTRY", "0.5"),
+    ("prop_skew_exit", "PROP_SKEW_EXIT", "0.5"),
+    ("quantity", "QUANTITY", "100"),
+    ("prop_maintain", "PROP_MAINTAIN", "0.2"),
+    ("reconcile_interval", "RECONCILE_INTERVAL", "300"),
+)
+
+# Optional numeric fields: unset or blank means None
+_ENV_OPTIONAL_FLOAT_FIELDS = (
+    ("quantity_bps_per_level", "QUANTITY_BPS_PER_LEVEL"),  # Overrides quantity if set
+    ("override_start_position", "OVERRIDE_START_POSITION"),
+)
+
+
 def load_influx_config() -> Optional[dict]:
     """
     Load InfluxDB connection config from environment variables.
@@ -61,7 +98,7 @@ def load_secrets_from_env(market_address: Optional[str] = None) -> SDKConfigs:
     Returns:
         Dictionary of SDK configs suitable for KuruClient.create(**configs)
     """
-    load_dotenv()
+    load_dotenv_once()
     return ConfigManager.load_all_configs(
         market_address=market_address,
         fetch_from_chain=True,
@@ -69,6 +106,43 @@ def load_secrets_from_env(market_address: Optional[str] = None) -> SDKConfigs:
     )
 
 
+def parse_toml_cached(toml_path: Path, data: Optional[bytes] = None) -> dict:
+    """
+    Parse a TOML file, reusing the previous result while the file is unchanged.
+
+    The returned dict is shared with the cache and must be treated as read-only.
+
+    Args:
+        toml_path: Path to the TOML file
+        data: File contents already read by the caller. The cache is then
+            matched on these bytes rather than on the file's size/mtime.
+
+    Returns:
+        Parsed TOML document
+    """
+    cached = _TOML_CACHE.get(toml_path)
+    if data is None:
+        # Stat before reading: a write in between caches newer bytes under the
+        # older fingerprint, which only causes an extra re-read next time
+        stat = toml_path.stat()
+        fingerprint: Optional[tuple[int, int]] = (stat.st_size, stat.st_mtime_ns)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[2]
+        data = toml_path.read_bytes()
+    else:
+        fingerprint = None
+        if cached is not None and cached[1] == data:
+            return cached[2]
+    config_dict = tomllib.loads(data.decode("utf-8"))
+
+    _TOML_CACHE.pop(toml_path, None)
+    if len(_TOML_CACHE) >= _TOML_CACHE_MAX_ENTRIES:
+        # Dicts iterate in insertion order: evict the oldest entry
+        del _TOML_CACHE[next(iter(_TOML_CACHE))]
+    _TOML_CACHE[toml_path] = (fingerprint, data, config_dict)
+    return config_dict
+
+
 def load_operational_config(toml_path: Path) -> BotConfig:
     """
     Load operational configuration from TOML file.
@@ -87,8 +161,7 @@ def load_operational_config(toml_path: Path) -> BotConfig:
         raise FileNotFoundError(f"Config file not found: {toml_path}")
 
     # Parse TOML
-    with open(toml_path, "rb") as f:
-        config_dict = tomllib.load(f)
+    config_dict = parse_toml_cached(toml_path)
 
     # Extract strategy section
     if "strategy" not in config_dict:
@@ -146,8 +219,30 @@ def load_operational_config(toml_path: Path) -> BotConfig:
         valid_states = ("proposed", "voted", "finalized", "committed")
         if depth_state not in valid_states:
             raise ValueError(f"kuru_depth_state must be one of {valid_states}, got '{depth_state}'")
+        if float(strategy.get("kuru_max_book_age", 30.0)) <= 0:
+            raise ValueError(f"kuru_max_book_age must be > 0, got {strategy['kuru_max_book_age']}")
+
+    return bot_config_from_strategy(strategy)
+
+
+def _optional_float(value) -> Optional[float]:
+    """float(value), or None if the key was absent/null."""
+    return float(value) if value is not None else None
+
 
-    # Build BotConfig
+def bot_config_from_strategy(strategy: dict) -> BotConfig:
+    """
+    Build a BotConfig from an already-validated [strategy] table.
+
+    Shared by startup loading and hot-reload so both produce identical configs.
+
+    Args:
+        strategy: The [strategy] section of bot_config.toml
+
+    Returns:
+        BotConfig with each field coerced once
+    """
+    has_quoters_config = "quoters" in strategy and isinstance(strategy["quoters"], list)
     return BotConfig(
         prop_maintain=float(strategy["prop_maintain"]),
         reconcile_interval=float(strategy["reconcile_interval"]),
@@ -155,22 +250,15 @@ def load_operational_config(toml_path: Path) -> BotConfig:
         prop_skew_entry=float(strategy.get("prop_skew_entry", 0.5)),
         prop_skew_exit=float(strategy.get("prop_skew_exit", 0.5)),
         quantity=float(strategy.get("quantity", 0)),
-        quantity_bps_per_level=(
-            float(strategy["quantity_bps_per_level"])
-            if strategy.get("quantity_bps_per_level") is not None
-            else None
-        ),
-        quoters_bps=[float(x) for x in strategy["quoters_bps"]] if "quoters_bps" in strategy else [],
+        quantity_bps_per_level=_optional_float(strategy.get("quantity_bps_per_level")),
+        quoters_bps=tuple(float(x) for x in strategy.get("quoters_bps", ())),
         oracle_source=strategy["oracle_source"],
         coinbase_symbol=strategy.get("coinbase_symbol"),
         kuru_symbol=strategy.get("kuru_symbol"),
         kuru_depth_state=strategy.get("kuru_depth_state", "committed"),
+        kuru_max_book_age=float(strategy.get("kuru_max_book_age", 30.0)),
         market_address=strategy.get("market_address"),
-        override_start_position=(
-            float(strategy["override_start_position"])
-            if strategy.get("override_start_position") is not None
-            else None
-        ),
+        override_start_position=_optional_float(strategy.get("override_start_position")),
         quoter_type=strategy.get("quoter_type", "skew"),
         quoters_config=strategy.get("quoters") if has_quoters_config else None,
     )
@@ -183,36 +271,23 @@ def load_config_from_env() -> tuple[SDKConfigs, BotConfig]:
     Returns:
         tuple: (sdk_configs, bot_config)
     """
-    load_dotenv()
+    load_dotenv_once()
 
     # Load SDK configs
     sdk_configs = load_secrets_from_env()
 
     # Load bot config from .env (fallback when TOML doesn't exist)
-    quoters_bps_str = os.getenv("QUOTERS_BPS", "25,50,75")
-    quoters_bps = [float(x.strip()) for x in quoters_bps_str.split(",")]
-
-    # Load quantity (can be overridden by quantity_bps_per_level)
-    quantity = float(os.getenv("QUANTITY", "100"))
+    env_vals = {field: float(os.getenv(name, default)) for field, name, default in _ENV_FLOAT_FIELDS}
+    for field, name in _ENV_OPTIONAL_FLOAT_FIELDS:
+        raw = os.getenv(name)
+        env_vals[field] = float(raw) if raw and raw.strip() else None
 
-    # Load optional quantity_bps_per_level (overrides quantity if set)
-    quantity_bps_str = os.getenv("QUANTITY_BPS_PER_LEVEL")
-    quantity_bps_per_level = float(quantity_bps_str) if quantity_bps_str and quantity_bps_str.strip() else None
-
-    # Load optional override_start_position
-    override_pos_str = os.getenv("OVERRIDE_START_POSITION")
-    override_start_position = float(override_pos_str) if override_pos_str and override_pos_str.strip() else None
+    quoters_bps_str = os.getenv("QUOTERS_BPS", "25,50,75")
+    quoters_bps = tuple(float(x.strip()) for x in quoters_bps_str.split(","))
 
     bot_config = BotConfig(
-        max_position=float(os.getenv("MAX_POSITION", "1000")),
-        prop_skew_entry=float(os.getenv("PROP_SKEW_ENTRY", "0.5")),
-        prop_skew_exit=float(os.getenv("PROP_SKEW_EXIT", "0.5")),
-        quantity=quantity,
+        **env_vals,
         quoters_bps=quoters_bps,
-        prop_maintain=float(os.getenv("PROP_MAINTAIN", "0.2")),
-        quantity_bps_per_level=quantity_bps_per_level,
-        override_start_position=override_start_position,
-        reconcile_interval=float(os.getenv("RECONCILE_INTERVAL", "300")),
         oracle_source=os.getenv("ORACLE", "coinbase").lower(),
         coinbase_symbol=os.getenv("COINBASE_SYMBOL"),
         market_address=os.getenv("MARKET_ADDRESS"),
@@ -2,6 +2,11 @@
 Hot-reload configuration watcher.
 
 Monitors bot_config.toml for changes and triggers reload callbacks.
+
+On Linux with asyncinotify installed the watcher sleeps in the kernel until the
+config's directory reports a write or rename; otherwise it polls every
+poll_interval seconds (default 5). Either way a detected change is only applied
+once the file has stayed unchanged for the debounce window.
 """
 
 import asyncio
@@ -17,35 +22,52 @@ else:
 
 from loguru import logger
 
-from .config import BotConfig
+from .config import BotConfig, bot_config_from_strategy, parse_toml_cached
+
+try:
+    from asyncinotify import Inotify, Mask
+    _INOTIFY_AVAILABLE = True
+except (ImportError, OSError):  # not installed, or not Linux
+    _INOTIFY_AVAILABLE = False
 
 
 class ConfigWatcher:
     """
     Watches bot_config.toml for changes and triggers reload callback.
 
-    Change detection uses both mtime and SHA256 hash to handle:
+    Change detection fingerprints the file by (size, mtime_ns) and only hashes
+    the contents (BLAKE2b) when that fingerprint moves, to handle:
     - Rapid edits (mtime granularity issues)
     - Touch commands (mtime change without content change)
     - Network file systems (unreliable mtime)
     """
 
-    def __init__(self, config_path: Path, callback: Callable[[BotConfig], None]):
+    def __init__(
+        self,
+        config_path: Path,
+        callback: Callable[[BotConfig], None],
+        poll_interval: float = 5.0,
+        debounce: float = 0.5,
+    ):
         """
         Initialize config watcher.
 
         Args:
             config_path: Path to bot_config.toml
             callback: Function to call when config changes (receives new BotConfig)
+            poll_interval: Seconds between checks when polling (no inotify)
+            debounce: Seconds the file must stay unchanged before it is reloaded
         """
         self.config_path = config_path
         self.callback = callback
+        self.poll_interval = poll_interval
+        self.debounce = debounce
         self.watch_task: Optional[asyncio.Task] = None
         self.running = False
 
-        # Change detection state
-        self.last_mtime: float = 0.0
-        self.last_hash: str = ""
+        # Change detection state: (st_size, st_mtime_ns) and content digest
+        self.last_fingerprint: tuple[int, int] = (0, 0)
+        self.last_hash: bytes = b""
 
     async def start(self):
         """Start watching for config changes in background task."""
@@ -58,11 +80,17 @@ class ConfigWatcher:
         # Initialize change detection state
         if self.config_path.exists():
             stat = self.config_path.stat()
-            self.last_mtime = stat.st_mtime
-            self.last_hash = self._compute_hash()
-
-        self.watch_task = asyncio.create_task(self._watch_loop())
-        logger.info(f"🔄 Config watcher started: {self.config_path}")
+            self.last_fingerprint = (stat.st_size, stat.st_mtime_ns)
+            self.last_hash = self._compute_hash(self._read_bytes() or b"")
+
+        if _INOTIFY_AVAILABLE:
+            self.watch_task = asyncio.create_task(self._inotify_loop())
+        else:
+            self.watch_task = asyncio.create_task(self._watch_loop())
+        logger.info(
+            f"🔄 Config watcher started: {self.config_path} "
+            f"({'inotify' if _INOTIFY_AVAILABLE else 'polling'})"
+        )
 
     async def stop(self):
         """Stop watching and cleanup."""
@@ -81,82 +109,154 @@ class ConfigWatcher:
         logger.info("Config watcher stopped")
 
     async def _watch_loop(self):
-        """Main watch loop: check file every 5 seconds."""
+        """Polling watch loop: check file every poll_interval seconds."""
         while self.running:
             try:
-                await asyncio.sleep(5)
-
-                if not self.config_path.exists():
-                    # File deleted - warn but keep running
-                    if self.last_mtime > 0:  # Only warn once
-                        logger.warning(f"Config file deleted: {self.config_path}")
-                        self.last_mtime = 0
-                        self.last_hash = ""
-                    continue
-
-                # Check if file changed
-                if self._has_changed():
-                    logger.info(f"🔄 Config file changed, reloading: {self.config_path}")
-                    new_config = self._load_and_validate()
-
-                    if new_config:
-                        # Update change detection state
-                        stat = self.config_path.stat()
-                        self.last_mtime = stat.st_mtime
-                        self.last_hash = self._compute_hash()
-
-                        # Trigger callback
-                        self.callback(new_config)
-                    else:
-                        logger.error("❌ Config reload failed. Keeping current config.")
-
+                await asyncio.sleep(self.poll_interval)
+                await self._check_for_change()
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logger.error(f"Unexpected error in config watch loop: {e}")
-                import traceback
-                logger.error(traceback.format_exc())
+                logger.exception(f"Unexpected error in config watch loop: {e}")
+
+    async def _inotify_loop(self):
+        """
+        Event-driven watch loop: wake only when the config's directory reports a
+        finished write or a rename/create/delete of the config file.
+
+        The directory is watched rather than the file so editors that save by
+        writing a temp file and renaming it over the original are still seen.
+        Falls back to polling if the watch can't be set up (e.g. inotify limits).
+        """
+        name = self.config_path.name
+        try:
+            with Inotify() as inotify:
+                inotify.add_watch(
+                    self.config_path.parent,
+                    Mask.CLOSE_WRITE | Mask.MOVED_TO | Mask.CREATE | Mask.DELETE,
+                )
+                async for event in inotify:
+                    if not self.running:
+                        break
+                    if event.name is None or str(event.name) != name:
+                        continue
+                    try:
+                        # mtime + hash check still applies, collapsing multi-write saves
+                        await self._check_for_change()
+                    except Exception as e:
+                        logger.exception(f"Unexpected error in config watch loop: {e}")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"inotify config watch unavailable ({e}), falling back to polling")
+            await self._watch_loop()
+
+    async def _check_for_change(self) -> None:
+        """
+        Reload and apply the config if the file changed and has since settled.
+
+        stat, hashing and TOML parsing run in a worker thread so a slow
+        filesystem (e.g. NFS) can't stall the event loop; the callback still
+        runs on the loop.
+        """
+        try:
+            stat = await asyncio.to_thread(self.config_path.stat)
+        except FileNotFoundError:
+            # File deleted - warn but keep running
+            if self.last_fingerprint != (0, 0):  # Only warn once
+                logger.warning(f"Config file deleted: {self.config_path}")
+                self.last_fingerprint = (0, 0)
+                self.last_hash = b""
+            return
+
+        if (stat.st_size, stat.st_mtime_ns) == self.last_fingerprint:
+            return
 
-    def _has_changed(self) -> bool:
+        # Debounce: editors may save in several writes; wait until the fingerprint
+        # stops moving so a half-written file isn't hashed or reloaded
+        while True:
+            await asyncio.sleep(self.debounce)
+            try:
+                settled = await asyncio.to_thread(self.config_path.stat)
+            except FileNotFoundError:
+                return  # Picked up as a deletion on the next check
+            if (settled.st_size, settled.st_mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                break
+            stat = settled
+
+        # Check if file changed (contents are read once, for both hash and parse)
+        changed = await asyncio.to_thread(self._read_if_changed, stat)
+        if changed is not None:
+            data, current_hash = changed
+
+            logger.info(f"🔄 Config file changed, reloading: {self.config_path}")
+            new_config = await asyncio.to_thread(self._load_and_validate, data)
+
+            if new_config:
+                # Update change detection state from the stat/hash already taken
+                self.last_fingerprint = (stat.st_size, stat.st_mtime_ns)
+                self.last_hash = current_hash
+
+                # Trigger callback
+                self.callback(new_config)
+            else:
+                logger.error("❌ Config reload failed. Keeping current config.")
+
+    def _read_if_changed(self, stat) -> Optional[tuple[bytes, bytes]]:
         """
         Check if config file has changed.
 
-        Uses both mtime and content hash for robust change detection.
+        (size, mtime_ns) unchanged means no change without reading the file;
+        otherwise the content hash decides (handles touch commands, network FS).
+
+        Args:
+            stat: Fresh os.stat_result for the config file
 
         Returns:
-            True if file changed, False otherwise
+            (contents, content hash) if the file changed, None otherwise
         """
-        if not self.config_path.exists():
-            return False
+        fingerprint = (stat.st_size, stat.st_mtime_ns)
+        if fingerprint == self.last_fingerprint:
+            return None
 
-        # Quick check: mtime
-        stat = self.config_path.stat()
-        if stat.st_mtime <= self.last_mtime:
-            return False  # No mtime change
+        data = self._read_bytes()
+        if data is None:
+            return None
 
-        # Confirm with hash (handles touch commands, network FS issues)
-        current_hash = self._compute_hash()
-        return current_hash != self.last_hash
+        current_hash = self._compute_hash(data)
+        if current_hash == self.last_hash:
+            # Touched but identical: remember the new fingerprint so the next
+            # wakeup doesn't hash the same contents again
+            self.last_fingerprint = fingerprint
+            return None
+        return data, current_hash
 
-    def _compute_hash(self) -> str:
-        """Compute SHA256 hash of config file."""
+    def _read_bytes(self) -> Optional[bytes]:
+        """Read the raw config file, or None if it can't be read."""
         try:
-            return hashlib.sha256(self.config_path.read_bytes()).hexdigest()
+            return self.config_path.read_bytes()
         except Exception as e:
-            logger.error(f"Failed to compute hash for {self.config_path}: {e}")
-            return ""
+            logger.error(f"Failed to read {self.config_path}: {e}")
+            return None
+
+    @staticmethod
+    def _compute_hash(data: bytes) -> bytes:
+        """Compute a BLAKE2b digest of the config contents (change detection only)."""
+        return hashlib.blake2b(data, digest_size=16).digest()
 
-    def _load_and_validate(self) -> Optional[BotConfig]:
+    def _load_and_validate(self, data: Optional[bytes] = None) -> Optional[BotConfig]:
         """
         Load and validate TOML configuration.
 
+        Args:
+            data: Config file contents already read for hashing (read from disk if None)
+
         Returns:
             BotConfig if successful, None if error
         """
         try:
             # Parse TOML
-            with open(self.config_path, "rb") as f:
-                config_dict = tomllib.load(f)
+            config_dict = parse_toml_cached(self.config_path, data)
 
             # Extract strategy section
             if "strategy" not in config_dict:
@@ -239,6 +339,8 @@ class ConfigWatcher:
             if strategy.get("oracle_source") == "kuru":
                 if "kuru_symbol" not in strategy or not strategy["kuru_symbol"]:
                     errors.append("kuru_symbol required when oracle_source='kuru' (e.g. 'mon_ausd')")
+                if float(strategy.get("kuru_max_book_age", 30.0)) <= 0:
+                    errors.append(f"Invalid kuru_max_book_age: {strategy['kuru_max_book_age']} (must be > 0.0)")
 
             # Report all validation errors
             if errors:
@@ -246,39 +348,15 @@ class ConfigWatcher:
                     logger.error(f"Config validation error: {error}")
                 return None
 
-            # Build BotConfig
-            return BotConfig(
-                prop_maintain=float(strategy["prop_maintain"]),
-                reconcile_interval=float(strategy["reconcile_interval"]),
-                max_position=float(strategy.get("max_position", 0)),
-                prop_skew_entry=float(strategy.get("prop_skew_entry", 0.5)),
-                prop_skew_exit=float(strategy.get("prop_skew_exit", 0.5)),
-                quantity=float(strategy.get("quantity", 0)),
-                quantity_bps_per_level=(
-                    float(strategy["quantity_bps_per_level"])
-                    if strategy.get("quantity_bps_per_level") is not None
-                    else None
-                ),
-                quoters_bps=[float(x) for x in strategy["quoters_bps"]] if "quoters_bps" in strategy else [],
-                oracle_source=strategy["oracle_source"],
-                coinbase_symbol=strategy.get("coinbase_symbol"),
-                market_address=strategy.get("market_address"),
-                override_start_position=(
-                    float(strategy["override_start_position"])
-                    if strategy.get("override_start_position") is not None
-                    else None
-                ),
-                quoter_type=strategy.get("quoter_type", "skew"),
-                quoters_config=strategy.get("quoters") if has_quoters_config else None,
-            )
+            # Build BotConfig (same construction as startup loading)
+            return bot_config_from_strategy(strategy)
 
+        except tomllib.TOMLDecodeError as e:
+            # Expected while someone is mid-edit: no traceback needed
+            logger.error(f"Failed to parse TOML: {e}")
+            return None
         except Exception as e:
-            if isinstance(e, (tomllib.TOMLDecodeError if sys.version_info >= (3, 11) else Exception)):
-                logger.error(f"Failed to parse TOML: {e}")
-            else:
-                logger.error(f"Unexpected error loading config: {e}")
-                import traceback
-                logger.error(traceback.format_exc())
+            logger.exception(f"Unexpected error loading config: {e}")
             return None
 
 
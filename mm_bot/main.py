@@ -7,9 +7,29 @@ from pathlib import Path
 from datetime import datetime
 from loguru import logger
 
-from mm_bot.config.config import load_config_from_env, load_secrets_from_env, load_operational_config
+from mm_bot.config.config import (
+    load_config_from_env,
+    load_dotenv_once,
+    load_secrets_from_env,
+    load_operational_config,
+)
 from mm_bot.bot.bot import Bot
 
+try:
+    import uvloop
+    _UVLOOP_AVAILABLE = True
+except ImportError:  # not installed, or Windows
+    _UVLOOP_AVAILABLE = False
+
+
+# stdlib level name -> loguru level name, resolved once instead of per record.
+# Custom stdlib levels fall back to their numeric level.
+_LOGURU_LEVELS = {
+    name: logger.level(name).name
+    for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+_LOGGING_FILE = logging.__file__
+
 
 class InterceptHandler(logging.Handler):
     """
@@ -18,14 +38,11 @@ class InterceptHandler(logging.Handler):
     """
     def emit(self, record):
         # Get corresponding loguru level
-        try:
-            level = logger.level(record.levelname).name
-        except ValueError:
-            level = record.levelno
+        level = _LOGURU_LEVELS.get(record.levelname, record.levelno)
 
         # Find caller from where the logged message originated
         frame, depth = logging.currentframe(), 2
-        while frame.f_code.co_filename == logging.__file__:
+        while frame.f_code.co_filename == _LOGGING_FILE:
             frame = frame.f_back
             depth += 1
 
@@ -37,8 +54,7 @@ async def main():
     Main entry point for the market making bot.
     """
     # Load .env early so SDK_LOG_LEVEL and other vars are available before setup
-    from dotenv import load_dotenv
-    load_dotenv()
+    load_dotenv_once()
 
     # Configure loguru: remove default DEBUG console handler, replace with configured level
     sdk_log_level = os.getenv("SDK_LOG_LEVEL", "INFO").upper()
@@ -64,9 +80,6 @@ async def main():
         compression="zip"
     )
 
-    # Intercept standard library logging (used by SDK and other libraries)
-    logging.basicConfig(handlers=[InterceptHandler()], level=logging.INFO, force=True)
-
     # Set SDK log level from environment variable
     # SDK_LOG_LEVEL options: DEBUG, INFO, WARNING, ERROR (default: INFO)
     log_level_map = {
@@ -78,6 +91,11 @@ async def main():
 
     sdk_level = log_level_map.get(sdk_log_level, logging.INFO)
 
+    # Intercept standard library logging (used by SDK and other libraries).
+    # The handler level matches the loguru sinks, so records they would drop are
+    # rejected by logging's own level check before emit() runs.
+    logging.basicConfig(handlers=[InterceptHandler(level=sdk_level)], level=logging.INFO, force=True)
+
     # Set log levels for various modules
     logging.getLogger("kuru_sdk_py").setLevel(sdk_level)  # SDK modules
     logging.getLogger("kuru_sdk_py.feed").setLevel(logging.ERROR)  # SDK feed module (very noisy)
@@ -132,8 +150,15 @@ async def main():
         logger.warning("\n🛑 Shutdown signal received...")
         bot.shutdown_event.set()
 
-    loop.add_signal_handler(signal.SIGINT, handle_shutdown)
-    loop.add_signal_handler(signal.SIGTERM, handle_shutdown)
+    # add_signal_handler is Unix-only; elsewhere (Windows) fall back to
+    # signal.signal and hop onto the loop thread to set the event
+    loop_signals = []
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, handle_shutdown)
+            loop_signals.append(sig)
+        except NotImplementedError:
+            signal.signal(sig, lambda signum, frame: loop.call_soon_threadsafe(handle_shutdown))
 
     try:
         # Start bot
@@ -148,11 +173,11 @@ async def main():
 
     finally:
         # Cleanup signal handlers
-        try:
-            loop.remove_signal_handler(signal.SIGINT)
-            loop.remove_signal_handler(signal.SIGTERM)
-        except Exception:
-            pass
+        for sig in loop_signals:
+            try:
+                loop.remove_signal_handler(sig)
+            except Exception:
+                pass
 
         # Stop bot
         await bot.stop()
@@ -161,4 +186,8 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # libuv-based loop when installed: cheaper callback/task scheduling
+    if _UVLOOP_AVAILABLE:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
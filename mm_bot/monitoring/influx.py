@@ -174,7 +174,7 @@ class InfluxWriter:
 
     @staticmethod
     def _ts() -> int:
-        return int(time.time() * 1_000_000_000)
+        return time.time_ns()
 
     # ------------------------------------------------------------------
     # Public write methods
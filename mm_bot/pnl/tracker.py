@@ -1,4 +1,4 @@
-from mm_bot.position.position_tracker import PositionTracker
+from mm_bot.position.position_tracker import PositionTracker, _to_decimal
 from mm_bot.pricing.oracle import OracleService
 from decimal import Decimal
 from typing import Optional
@@ -11,6 +11,11 @@ class PnlTracker:
         self.oracle_service = oracle_service
         self.market_id = market_id
         self.source_name = source_name
+        self._price_source = oracle_service.resolve(source_name)
+        # Last oracle price and its Decimal form: get_pnl runs up to twice per
+        # main-loop iteration, usually against an unchanged price
+        self._last_price = None
+        self._last_price_dec = Decimal("0")
 
     def get_pnl(self) -> Optional[Decimal]:
         """
@@ -19,12 +24,16 @@ class PnlTracker:
         Returns:
             PnL
         """
-        price = self.oracle_service.get_price(self.market_id, self.source_name)
+        source = self._price_source
+        price = source.get_price(self.market_id) if source is not None else None
         if price is None:
             return None
 
         position = self.position_tracker.get_current_position()
-        price_dec = Decimal(str(price))
+        if price != self._last_price:
+            self._last_price = price
+            self._last_price_dec = _to_decimal(price)
+        price_dec = self._last_price_dec
         return self.position_tracker.get_quote_position() + position * price_dec
 
     def monitor_pnl(self) -> None:
@@ -2,14 +2,84 @@ from typing import Optional
 from pathlib import Path
 from datetime import datetime
 from decimal import Decimal
+import asyncio
+import functools
 import json
+import os
+import time
 from loguru import logger
 
+from mm_bot.kuru_imports import OrderSide
+
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    _json_loads = json.loads
+
+
+# Fill side -> (sign of the base-position change, log label)
+_SIDE_SIGN = {OrderSide.BUY: (1, "BUY"), OrderSide.SELL: (-1, "SELL")}
+
+# Fills arriving within this window share one position_state.json write
+STATE_SAVE_DELAY = 0.5
+
+
+# Debug logs already truncated by this process; later trackers append instead
+_truncated_logs: set[Path] = set()
+
+
+@functools.lru_cache(maxsize=1)
+def _tracking_dir() -> Path:
+    """The tracking/ output directory, created on first use."""
+    path = Path("tracking")
+    path.mkdir(exist_ok=True)
+    return path
+
+
+# Cached "HH:MM:SS" of the current wall-clock second for _log_timestamp
+_ts_second = -1
+_ts_prefix = ""
+
+
+def _log_timestamp() -> str:
+    """
+    Local "HH:MM:SS.mmm" timestamp for the debug trace files.
+
+    The seconds part is formatted once per second and reused; only the
+    milliseconds are formatted per call.
+    """
+    global _ts_second, _ts_prefix
+    t_ns = time.time_ns()
+    sec = t_ns // 1_000_000_000
+    if sec != _ts_second:
+        _ts_second = sec
+        _ts_prefix = time.strftime("%H:%M:%S", time.localtime(sec))
+    return f"{_ts_prefix}.{(t_ns // 1_000_000) % 1000:03d}"
+
+
+# Exact-type dispatch for _to_decimal: Decimal passes through, int and str are
+# exact in the constructor. Anything else (float) goes through str so 0.1 stays
+# Decimal("0.1") rather than its binary expansion.
+_DECIMAL_CONVERTERS = {
+    Decimal: lambda value: value,
+    int: Decimal,
+    str: Decimal,
+}
+
 
 def _to_decimal(value) -> Decimal:
     """Convert numeric values to Decimal without binary float artifacts."""
-    if isinstance(value, Decimal):
-        return value
+    convert = _DECIMAL_CONVERTERS.get(type(value))
+    if convert is not None:
+        return convert(value)
     return Decimal(str(value))
 
 
@@ -20,34 +90,91 @@ class PositionTracker:
     Position tracking is callback-based - updates occur when orders are filled.
     Buy orders increase position, sell orders decrease position.
     """
-
-    def __init__(self, starting_position: float | Decimal = 0.0):
+    # Read and written on every fill: slots avoid the instance __dict__ lookup
+    __slots__ = (
+        "current_position",
+        "quote_position",
+        "debug_log_path",
+        "state_file_path",
+        "_debug_enabled",
+        "_debug_fh",
+        "_save_handle",
+    )
+
+    def __init__(self, starting_position: float | Decimal = 0.0, debug_enabled: bool = True):
         """
         Initialize position tracker.
 
         Args:
             starting_position: Initial position in base currency
+            debug_enabled: Write the per-fill trace to position_tracker_debug.log
+                (the bot passes POSITION_DEBUG_LOG through)
         """
         self.current_position = _to_decimal(starting_position)  # Total position in base currency
         self.quote_position = Decimal("0")  # Net quote spent/received
 
         # Setup debug log file
-        debug_log_dir = Path("tracking")
-        debug_log_dir.mkdir(exist_ok=True)
+        debug_log_dir = _tracking_dir()
         self.debug_log_path = debug_log_dir / "position_tracker_debug.log"
         self.state_file_path = debug_log_dir / "position_state.json"
 
-        # Create/clear debug log file
-        with open(self.debug_log_path, 'w') as f:
-            f.write(f"=== Position Tracker Debug Log - Started {datetime.now().isoformat()} ===\n")
-            f.write(f"Initial position: {float(self.current_position):.6f}\n\n")
+        # Create/clear debug log file. Kept open with a large buffer; the bot
+        # flushes it once per main-loop iteration (flush) and closes it on stop (close)
+        self._debug_enabled = debug_enabled
+        self._debug_fh = None
+        if debug_enabled:
+            # Truncate once per process so a replacement tracker keeps the earlier trace
+            mode = 'a' if self.debug_log_path in _truncated_logs else 'w'
+            _truncated_logs.add(self.debug_log_path)
+            self._debug_fh = open(self.debug_log_path, mode, buffering=65536)
+            self._debug_fh.write(f"=== Position Tracker Debug Log - Started {datetime.now().isoformat()} ===\n")
+            self._debug_fh.write(f"Initial position: {float(self.current_position):.6f}\n\n")
+
+        # Pending coalesced save_state() (see _schedule_save)
+        self._save_handle: Optional[asyncio.TimerHandle] = None
 
     def _debug_log(self, message: str) -> None:
-        """Write to both logger and debug file."""
+        """
+        Write to both logger and debug file.
+
+        update_position checks self._debug_enabled before calling so the trace
+        f-strings aren't formatted when debug logging is off.
+        """
         logger.debug(message)
-        with open(self.debug_log_path, 'a') as f:
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            f.write(f"[{timestamp}] {message}\n")
+        if self._debug_fh is not None:
+            self._debug_fh.write(f"[{_log_timestamp()}] {message}\n")
+
+    def flush(self) -> None:
+        """Push buffered debug lines to disk."""
+        if self._debug_fh is not None:
+            try:
+                self._debug_fh.flush()
+            except OSError as e:
+                logger.warning(f"Failed to flush position tracker debug log: {e}")
+
+    def close(self) -> None:
+        """Write any pending state and close the debug log."""
+        if self._save_handle is not None:
+            self.save_state()
+        if self._debug_fh is not None:
+            self.flush()
+            self._debug_fh.close()
+            self._debug_fh = None
+
+    def _schedule_save(self) -> None:
+        """
+        Save state STATE_SAVE_DELAY seconds from now, coalescing fills that land
+        in the meantime into a single write. Saves immediately when called
+        outside an event loop.
+        """
+        if self._save_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save_state()
+            return
+        self._save_handle = loop.call_later(STATE_SAVE_DELAY, self.save_state)
 
     def update_position(self, side, filled_size: float | Decimal, price: float | Decimal) -> None:
         """
@@ -58,54 +185,51 @@ class PositionTracker:
             filled_size: Amount that was filled
             price: Fill price
         """
-        # Import here to avoid circular dependency
-        import sys
-        from pathlib import Path
-        our_src = Path(__file__).resolve().parent.parent.parent
-        if str(our_src) not in sys.path:
-            sys.path.insert(0, str(our_src))
-        from mm_bot.kuru_imports import OrderSide
+        sign, label = _SIDE_SIGN.get(side, (0, None))
 
         filled_size_dec = _to_decimal(filled_size)
         price_dec = _to_decimal(price)
+        # Float forms for log formatting, converted once per fill
+        filled_size_f = float(filled_size_dec)
+        price_f = float(price_dec)
 
-        self._debug_log(
-            f"[POSITION] BEFORE fill - position: {float(self.current_position):.2f}"
-        )
-        self._debug_log(
-            f"[POSITION] Fill details - side: {side.value if hasattr(side, 'value') else side}, "
-            f"filled_size: {float(filled_size_dec):.2f}, price: {float(price_dec):.6f}"
-        )
-
-        if side == OrderSide.BUY:
-            self.current_position += filled_size_dec
-            self.quote_position -= price_dec * filled_size_dec
+        debug = self._debug_enabled
+        if debug:
             self._debug_log(
-                f"[POSITION] AFTER BUY - position: {float(self.current_position):.2f} "
-                f"(+{float(filled_size_dec):.2f})"
-            )
-            logger.info(
-                f"Position update (BUY): +{float(filled_size_dec)} base @ {float(price_dec)} | "
-                f"Total: {float(self.get_current_position())}"
+                f"[POSITION] BEFORE fill - position: {float(self.current_position):.2f}"
             )
-        elif side == OrderSide.SELL:
-            self.current_position -= filled_size_dec
-            self.quote_position += price_dec * filled_size_dec
             self._debug_log(
-                f"[POSITION] AFTER SELL - position: {float(self.current_position):.2f} "
-                f"(-{float(filled_size_dec):.2f})"
+                f"[POSITION] Fill details - side: {side.value if hasattr(side, 'value') else side}, "
+                f"filled_size: {filled_size_f:.2f}, price: {price_f:.6f}"
             )
+
+        if sign:
+            # One signed update for both sides: BUY adds base / spends quote, SELL the reverse
+            base_delta = filled_size_dec if sign > 0 else -filled_size_dec
+            self.current_position += base_delta
+            self.quote_position -= price_dec * base_delta
+            sign_char = "+" if sign > 0 else "-"
+            position_f = float(self.current_position)
+            if debug:
+                self._debug_log(
+                    f"[POSITION] AFTER {label} - position: {position_f:.2f} "
+                    f"({sign_char}{filled_size_f:.2f})"
+                )
+            # Formatted by loguru only if an INFO sink is active
             logger.info(
-                f"Position update (SELL): -{float(filled_size_dec)} base @ {float(price_dec)} | "
-                f"Total: {float(self.get_current_position())}"
+                "Position update ({}): {}{} base @ {} | Total: {}",
+                label, sign_char, filled_size_f, price_f, position_f,
             )
+        else:
+            position_f = float(self.current_position)
 
-        self._debug_log(
-            f"[POSITION] New position: {float(self.current_position):.2f}\n"
-        )
+        if debug:
+            self._debug_log(
+                f"[POSITION] New position: {position_f:.2f}\n"
+            )
 
-        # Auto-save state after each position update
-        self.save_state()
+        # Auto-save state shortly after the update (burst of fills -> one write)
+        self._schedule_save()
 
 
     def get_current_position(self) -> Decimal:
@@ -129,7 +253,13 @@ class PositionTracker:
     def save_state(self) -> None:
         """
         Save position state to JSON file for persistence across restarts.
+
+        Written to a temp file and renamed over the old one, so a crash mid-write
+        never leaves a truncated state file.
         """
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
         try:
             state = {
                 'current_position': str(self.current_position),
@@ -137,8 +267,9 @@ class PositionTracker:
                 'last_updated': datetime.now().isoformat()
             }
 
-            with open(self.state_file_path, 'w') as f:
-                json.dump(state, f, indent=2)
+            tmp_path = self.state_file_path.with_suffix('.tmp')
+            tmp_path.write_bytes(_json_dumps(state))
+            os.replace(tmp_path, self.state_file_path)
 
             logger.debug(f"Position state saved: position={float(self.current_position):.2f}")
         except Exception as e:
@@ -163,8 +294,7 @@ class PositionTracker:
                 logger.info("No saved position state found (first run)")
                 return None
 
-            with open(state_file_path, 'r') as f:
-                state = json.load(f)
+            state = _json_loads(state_file_path.read_bytes())
 
             # Migration: Handle old format with start_position + current_position
             if 'total_position' in state:
@@ -1,5 +1,7 @@
 import requests
 import asyncio
+import statistics
+import time
 import websockets
 import json
 from typing import Optional, Dict
@@ -7,6 +9,12 @@ from abc import ABC, abstractmethod
 from loguru import logger
 import threading
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class PriceSource(ABC):
     """Abstract base class for price sources"""
@@ -16,33 +24,146 @@ class PriceSource(ABC):
         """Get price from the source"""
         pass
 
+    async def get_price_async(self, market_id: str) -> Optional[float]:
+        """Get price without blocking the event loop (default: the sync read)."""
+        return self.get_price(market_id)
+
 
 class CoinbasePriceSource(PriceSource):
-    """Fetch price from Coinbase API"""
+    """
+    Fetch price from Coinbase API.
+
+    The HTTP call is blocking, so prices are served stale-while-revalidate:
+    - younger than cache_ttl: returned as is
+    - younger than max_stale: returned as is while one background thread
+      refetches (concurrent readers don't start a second fetch)
+    - older, or never fetched: fetched synchronously (get_price_async does
+      this in a worker thread)
+    After failure_threshold consecutive failed fetches the source stops
+    calling Coinbase for open_seconds (circuit breaker) so an outage costs
+    None immediately rather than a timeout per read.
+    The keep-alive session avoids a new TLS handshake per fetch.
+    """
 
-    def __init__(self, symbol: str = "MON-USD"):
+    def __init__(
+        self,
+        symbol: str = "MON-USD",
+        cache_ttl: float = 1.0,
+        max_stale: float = 5.0,
+        timeout: float = 2.0,
+        failure_threshold: int = 3,
+        open_seconds: float = 10.0,
+    ):
         """
         Initialize Coinbase price source.
 
         Args:
             symbol: Trading pair symbol (e.g., "MON-USD", "BTC-USD")
+            cache_ttl: Seconds a fetched price is served without refetching
+            max_stale: Seconds a price may still be served while a background
+                refresh runs; older prices are refetched before returning
+            timeout: HTTP timeout in seconds (bounds how long the caller blocks)
+            failure_threshold: Consecutive failed fetches that open the circuit
+            open_seconds: Seconds fetches are skipped once the circuit opens
         """
         self.symbol = symbol
+        self.cache_ttl = cache_ttl
+        self.max_stale = max_stale
+        self.timeout = timeout
+        self._url = f"https://api.coinbase.com/v2/prices/{symbol}/spot"
+        self._session = requests.Session()
+        self._session.headers.update({"Accept": "application/json"})
+        # (monotonic fetch time, price); a failed fetch is not cached
+        self._cached: Optional[tuple[float, float]] = None
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+        # Circuit breaker state
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self._fail_count = 0
+        self._open_until = 0.0
+
+    def _cached_price(self) -> tuple[Optional[float], bool]:
+        """
+        Serve from cache if possible.
+
+        Returns:
+            (price, hit): hit is False when the caller must fetch synchronously
+        """
+        cached = self._cached
+        if cached is None:
+            return None, False
+        age = time.monotonic() - cached[0]
+        if age < self.cache_ttl:
+            return cached[1], True
+        if age < self.max_stale:
+            self._start_background_refresh()
+            return cached[1], True
+        return None, False
 
     def get_price(self, market_id: str) -> Optional[float]:
         """
-        Fetch the latest price from Coinbase API.
+        Get the latest price from Coinbase API (stale-while-revalidate cache).
 
         Args:
             market_id (str): Not used for Coinbase, uses self.symbol instead
         """
-        url = f"https://api.coinbase.com/v2/prices/{self.symbol}/spot"
+        price, hit = self._cached_price()
+        if hit:
+            return price
+        return self._fetch_and_cache()
+
+    async def get_price_async(self, market_id: str) -> Optional[float]:
+        """Like get_price, but a blocking fetch runs in a worker thread."""
+        price, hit = self._cached_price()
+        if hit:
+            return price
+        return await asyncio.to_thread(self._fetch_and_cache)
+
+    def _start_background_refresh(self) -> None:
+        """Refetch in a daemon thread unless a refresh is already in flight."""
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
 
+        def refresh():
+            try:
+                self._fetch_and_cache()
+            finally:
+                with self._refresh_lock:
+                    self._refreshing = False
+
+        threading.Thread(target=refresh, daemon=True).start()
+
+    def _fetch_and_cache(self) -> Optional[float]:
+        """Fetch the spot price and cache it on success (blocking)."""
+        if time.monotonic() < self._open_until:
+            return None  # Circuit open: skip the request
+
+        price = self._fetch_price()
+        if price is not None:
+            self._cached = (time.monotonic(), price)
+            self._fail_count = 0
+            return price
+
+        self._fail_count += 1
+        if self._fail_count >= self.failure_threshold:
+            self._fail_count = 0
+            self._open_until = time.monotonic() + self.open_seconds
+            logger.warning(
+                f"Coinbase price fetch failed {self.failure_threshold} times in a row, "
+                f"pausing requests for {self.open_seconds:.0f}s"
+            )
+        return None
+
+    def _fetch_price(self) -> Optional[float]:
+        """Fetch the spot price over HTTP (blocking)."""
         try:
-            response = requests.get(url)
+            response = self._session.get(self._url, timeout=self.timeout)
             response.raise_for_status()
 
-            data = response.json()
+            data = _json_loads(response.content)
             if not data.get("data"):
                 return None
 
@@ -63,6 +184,10 @@ class CoinbasePriceSource(PriceSource):
 # "committed" — committed to chain, highest finality (slightly lagging)
 KURU_DEPTH_STATES = ("proposed", "voted", "finalized", "committed")
 
+# Kuru depth prices are 10^18-scaled; 1e18 is exact as a float, so one
+# float() parse + divide matches the big-int division to within an ulp
+_KURU_PRICE_SCALE = 1e18
+
 
 class KuruPriceSource(PriceSource):
     """
@@ -70,26 +195,32 @@ class KuruPriceSource(PriceSource):
 
     Maintains a WebSocket connection to wss://exchange.kuru.io and subscribes to
     the <symbol>@monadDepth channel. Calculates mid-price from best bid/ask.
+    The connection runs as a task on the caller's event loop (start/stop are
+    awaited from the bot).
 
     Args:
         depth_state: Which Monad block state to read prices from.
             One of "proposed", "voted", "finalized", "committed".
             Defaults to "committed" (safest). Use "proposed" for freshest prices.
+        max_book_age: Seconds without a book update after which get_price
+            returns None rather than a frozen mid-price.
     """
 
-    def __init__(self, depth_state: str = "committed"):
+    def __init__(self, depth_state: str = "committed", max_book_age: float = 30.0):
         if depth_state not in KURU_DEPTH_STATES:
             raise ValueError(f"depth_state must be one of {KURU_DEPTH_STATES}, got '{depth_state}'")
         self._depth_state = depth_state
-        self._best_bid: Optional[float] = None
-        self._best_ask: Optional[float] = None
+        self.max_book_age = max_book_age
+        # (best_bid, best_ask, monotonic update time), replaced as a whole so
+        # readers never see a bid from one update and an ask from another
+        self._book: Optional[tuple[float, float, float]] = None
         self._symbol: Optional[str] = None
         self._ws_task: Optional[asyncio.Task] = None
-        self._stop_event = asyncio.Event()
-        self._loop: Optional[asyncio.AbstractEventLoop] = None
-        self._ready_event = threading.Event()
+        # Created in start(), on the loop that runs the feed
+        self._stop_event: Optional[asyncio.Event] = None
+        self._ready_event: Optional[asyncio.Event] = None
 
-    def start(self, symbol: str) -> None:
+    async def start(self, symbol: str) -> None:
         """
         Start WebSocket connection in background.
 
@@ -97,25 +228,25 @@ class KuruPriceSource(PriceSource):
             symbol: Market symbol to subscribe to (e.g. "mon_ausd")
         """
         self._symbol = symbol
-
-        # Start WebSocket in background thread with its own event loop
-        def run_ws():
-            self._loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self._loop)
-            self._loop.run_until_complete(self._run_websocket())
-
-        ws_thread = threading.Thread(target=run_ws, daemon=True)
-        ws_thread.start()
+        self._stop_event = asyncio.Event()
+        self._ready_event = asyncio.Event()
+        self._ws_task = asyncio.create_task(self._run_websocket())
 
         # Wait for initial orderbook data (timeout 5s)
-        if not self._ready_event.wait(timeout=5.0):
+        try:
+            await asyncio.wait_for(self._ready_event.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
             logger.warning("Kuru WebSocket connection timed out waiting for initial data")
         else:
-            logger.success(f"✓ Kuru WebSocket connected (bid: {self._best_bid}, ask: {self._best_ask})")
+            bid, ask, _ = self._book
+            logger.success(f"✓ Kuru WebSocket connected (bid: {bid}, ask: {ask})")
 
     async def _run_websocket(self) -> None:
         """Run WebSocket connection (internal)"""
         uri = "wss://exchange.kuru.io"
+        # Frames without our depth state can't move the price
+        state_key = f'"{self._depth_state}"'
+        state_key_bytes = state_key.encode()
 
         while not self._stop_event.is_set():
             try:
@@ -128,16 +259,52 @@ class KuruPriceSource(PriceSource):
                     await websocket.send(json.dumps(subscribe_msg))
                     logger.debug(f"Subscribed to Kuru orderbook for {self._symbol}@monadDepth")
 
-                    # Process messages
-                    while not self._stop_event.is_set():
-                        try:
-                            message = await asyncio.wait_for(
-                                websocket.recv(),
-                                timeout=1.0
-                            )
-                            self._process_message(json.loads(message))
-                        except asyncio.TimeoutError:
-                            continue
+                    # Process messages. recv() blocks without a timeout; stop()
+                    # closes the socket instead, which ends the iteration
+                    async def close_on_stop():
+                        await self._stop_event.wait()
+                        await websocket.close()
+
+                    # Only the newest usable frame matters (each carries the top of
+                    # book), so the receiver just parks frames and the applier parses
+                    # from the newest back until one updates the book: a burst costs
+                    # one parse, and a trailing frame that _process_message ignores
+                    # (e.g. an empty side) doesn't discard the valid one before it
+                    pending: list = []
+                    frame_ready = asyncio.Event()
+
+                    async def apply_latest():
+                        while True:
+                            await frame_ready.wait()
+                            frame_ready.clear()
+                            frames = pending[:]
+                            pending.clear()
+                            book_before = self._book
+                            for message in reversed(frames):
+                                try:
+                                    self._process_message(_json_loads(message))
+                                except ValueError as e:
+                                    logger.warning(f"Failed to decode Kuru orderbook frame: {e}")
+                                except Exception as e:
+                                    # Nothing awaits this task, so dying here would leave the
+                                    # socket open with a frozen book; reconnect instead
+                                    logger.error(f"Kuru orderbook frame handling failed, reconnecting: {e}")
+                                    await websocket.close()
+                                    return
+                                if self._book is not book_before:
+                                    break
+
+                    closer = asyncio.create_task(close_on_stop())
+                    applier = asyncio.create_task(apply_latest())
+                    try:
+                        async for message in websocket:
+                            key = state_key_bytes if isinstance(message, bytes) else state_key
+                            if key in message:
+                                pending.append(message)
+                                frame_ready.set()
+                    finally:
+                        closer.cancel()
+                        applier.cancel()
 
             except Exception as e:
                 logger.error(f"Kuru WebSocket error: {e}")
@@ -165,21 +332,20 @@ class KuruPriceSource(PriceSource):
             if not bids or not asks:
                 return
 
-            best_bid = int(bids[0][0]) / (10 ** 18)
-            best_ask = int(asks[0][0]) / (10 ** 18)
+            best_bid = float(bids[0][0]) / _KURU_PRICE_SCALE
+            best_ask = float(asks[0][0]) / _KURU_PRICE_SCALE
 
             if best_bid <= 0 or best_ask <= 0:
                 return
 
-            self._best_bid = best_bid
-            self._best_ask = best_ask
+            self._book = (best_bid, best_ask, time.monotonic())
 
             if not self._ready_event.is_set():
                 self._ready_event.set()
 
-            logger.debug(f"Kuru orderbook updated: bid={self._best_bid:.6f}, ask={self._best_ask:.6f}")
+            logger.debug("Kuru orderbook updated: bid={:.6f}, ask={:.6f}", best_bid, best_ask)
 
-        except (KeyError, IndexError, TypeError, ValueError) as e:
+        except (AttributeError, KeyError, IndexError, TypeError, ValueError) as e:
             logger.warning(f"Failed to parse Kuru orderbook: {e}")
 
     def get_price(self, market_id: str) -> Optional[float]:
@@ -190,18 +356,27 @@ class KuruPriceSource(PriceSource):
             market_id: Market address (not used, set via start())
 
         Returns:
-            Mid-price or None if not available
+            Mid-price or None if not available or older than max_book_age
         """
-        if self._best_bid is None or self._best_ask is None:
+        book = self._book
+        if book is None:
             return None
+        if time.monotonic() - book[2] > self.max_book_age:
+            return None
+        return (book[0] + book[1]) * 0.5
 
-        mid_price = (self._best_bid + self._best_ask) / 2
-        return mid_price
-
-    def stop(self) -> None:
+    async def stop(self) -> None:
         """Stop WebSocket connection"""
-        if self._loop:
-            self._loop.call_soon_threadsafe(self._stop_event.set)
+        if self._stop_event is not None:
+            self._stop_event.set()
+        if self._ws_task:
+            # Cancel too: the task may be sleeping between reconnect attempts
+            self._ws_task.cancel()
+            try:
+                await self._ws_task
+            except asyncio.CancelledError:
+                pass
+            self._ws_task = None
 
 
 class OracleService:
@@ -212,6 +387,15 @@ class OracleService:
         """Add a new price source to the service"""
         self.price_sources[name] = source
 
+    def resolve(self, source_name: str) -> Optional[PriceSource]:
+        """
+        Look up a price source once so per-tick callers can hold on to it.
+
+        Callers keep the source they resolved; re-resolve after replacing a
+        source with add_price_source.
+        """
+        return self.price_sources.get(source_name)
+
     def get_price(self, market_id: str, source_name: str) -> Optional[float]:
         """Get price from a specific source"""
         source = self.price_sources.get(source_name)
@@ -219,15 +403,31 @@ class OracleService:
             return None
         return source.get_price(market_id)
 
+    async def get_price_async(self, market_id: str, source_name: str) -> Optional[float]:
+        """Get price from a specific source without blocking the event loop"""
+        source = self.price_sources.get(source_name)
+        if not source:
+            return None
+        return await source.get_price_async(market_id)
+
     def get_average_price(self, market_id: str) -> Optional[float]:
         """Get average price across all available sources"""
-        prices = []
-        for source in self.price_sources.values():
-            price = source.get_price(market_id)
-            if price is not None:
-                prices.append(price)
-
+        prices = [
+            price
+            for source in self.price_sources.values()
+            if (price := source.get_price(market_id)) is not None
+        ]
         if not prices:
             return None
-
-        return sum(prices) / len(prices)
+        return statistics.fmean(prices)
+
+    async def get_average_price_async(self, market_id: str) -> Optional[float]:
+        """Average price across all sources, polling them concurrently"""
+        results = await asyncio.gather(
+            *(source.get_price_async(market_id) for source in self.price_sources.values()),
+            return_exceptions=True,
+        )
+        prices = [r for r in results if isinstance(r, float)]
+        if not prices:
+            return None
+        return statistics.fmean(prices)
@@ -1,10 +1,16 @@
 import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
+from typing import Optional
 
 from mm_bot.kuru_imports import OrderSide
 from mm_bot.quoter.context import QuoterContext, QuoterDecision
 
+# Decimal constants for the edge helpers, parsed once instead of per call
+_ONE = Decimal("1")
+_BPS = Decimal("10000")
+_PER_BPS = Decimal("0.0001")  # 1/_BPS; exact, so multiplying matches dividing by _BPS
+
 
 class BaseQuoter(ABC):
     """
@@ -30,24 +36,38 @@ class BaseQuoter(ABC):
         """
         self.quoter_id = quoter_id
         self.quantity = quantity
+        # quoter_id is fixed for the quoter's lifetime; build the prefixes once
+        # rather than on every main-loop lookup
+        self._cloid_prefix_bid = f"bid-{quoter_id}-"
+        self._cloid_prefix_ask = f"ask-{quoter_id}-"
 
     @property
     def cloid_prefix_bid(self) -> str:
         """Prefix for matching bid cloids back to this quoter."""
-        return f"bid-{self.quoter_id}-"
+        return self._cloid_prefix_bid
 
     @property
     def cloid_prefix_ask(self) -> str:
         """Prefix for matching ask cloids back to this quoter."""
-        return f"ask-{self.quoter_id}-"
+        return self._cloid_prefix_ask
 
     def owns_cloid(self, cloid: str) -> bool:
         """Check if a cloid belongs to this quoter."""
-        return cloid.startswith(self.cloid_prefix_bid) or cloid.startswith(self.cloid_prefix_ask)
+        return cloid.startswith((self._cloid_prefix_bid, self._cloid_prefix_ask))
+
+    def make_cloid(self, side: str, timestamp: Optional[int] = None) -> str:
+        """
+        Generate a new cloid for this quoter. side is 'bid' or 'ask'.
 
-    def make_cloid(self, side: str) -> str:
-        """Generate a new cloid for this quoter. side is 'bid' or 'ask'."""
-        timestamp = int(time.time() * 1000)
+        timestamp (ms) lets a quoter stamp a bid/ask pair with one clock read;
+        defaults to now.
+        """
+        if timestamp is None:
+            timestamp = time.time_ns() // 1_000_000
+        if side == "bid":
+            return f"{self._cloid_prefix_bid}{timestamp}"
+        if side == "ask":
+            return f"{self._cloid_prefix_ask}{timestamp}"
         return f"{side}-{self.quoter_id}-{timestamp}"
 
     @abstractmethod
@@ -89,9 +109,9 @@ class BaseQuoter(ABC):
     ) -> Decimal:
         """Calculate edge in bps of an existing order relative to reference price."""
         if order_side == OrderSide.BUY:
-            return (reference_price - order_price) / reference_price * Decimal("10000")
+            return (reference_price - order_price) / reference_price * _BPS
         else:
-            return (order_price - reference_price) / reference_price * Decimal("10000")
+            return (order_price - reference_price) / reference_price * _BPS
 
     @staticmethod
     def price_from_edge(
@@ -101,6 +121,6 @@ class BaseQuoter(ABC):
     ) -> Decimal:
         """Convert an edge in bps to a price."""
         if side == OrderSide.BUY:
-            return reference_price * (Decimal("1") - edge_bps / Decimal("10000"))
+            return reference_price * (_ONE - edge_bps * _PER_BPS)
         else:
-            return reference_price * (Decimal("1") + edge_bps / Decimal("10000"))
+            return reference_price * (_ONE + edge_bps * _PER_BPS)
@@ -5,7 +5,7 @@ from typing import Optional
 from mm_bot.kuru_imports import Order, OrderSide
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExistingOrder:
     """An order the bot knows about, resolved from multiple tracking sources."""
     cloid: str
@@ -14,7 +14,7 @@ class ExistingOrder:
     source: str                 # "on_chain" | "callback" | "preregistered" | "unknown"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class QuoterContext:
     """
     Snapshot of market state passed to a quoter each iteration.
@@ -45,7 +45,7 @@ class QuoterContext:
     price_precision: Optional[Decimal] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QuoterDecision:
     """
     A quoter's output: which orders to cancel and which to place.
@@ -12,9 +12,10 @@ def register_quoter(name: str, cls: Type[BaseQuoter]) -> None:
 
 def get_quoter_class(name: str) -> Type[BaseQuoter]:
     """Look up a registered quoter class by name. Raises ValueError if not found."""
-    if name not in QUOTER_REGISTRY:
+    cls = QUOTER_REGISTRY.get(name)
+    if cls is None:
         available = list(QUOTER_REGISTRY.keys())
         raise ValueError(
             f"Unknown quoter type '{name}'. Available: {available}"
         )
-    return QUOTER_REGISTRY[name]
+    return cls
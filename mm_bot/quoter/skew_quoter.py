@@ -1,3 +1,4 @@
+import time
 from decimal import Decimal
 from typing import Optional
 
@@ -7,6 +8,17 @@ from mm_bot.kuru_imports import Order, OrderType, OrderSide
 from mm_bot.quoter.base import BaseQuoter
 from mm_bot.quoter.context import ExistingOrder, QuoterContext, QuoterDecision
 
+# Decimal constants for the per-tick edge math, parsed once
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+_NEG_ONE = Decimal("-1")
+
+# Enum members bound once; _evaluate_existing_order only ever sees these, so it
+# compares by identity
+_BUY = OrderSide.BUY
+_SELL = OrderSide.SELL
+_LIMIT = OrderType.LIMIT
+
 
 class SkewQuoter(BaseQuoter):
     """
@@ -32,24 +44,45 @@ class SkewQuoter(BaseQuoter):
         self.baseline_edge_bps = Decimal(str(baseline_edge_bps))
         self.prop_skew_entry = Decimal(str(prop_skew_entry))
         self.prop_skew_exit = Decimal(str(prop_skew_exit))
+        # Edge widening/tightening per unit of prop_of_max; fixed for the quoter's
+        # lifetime (skew changes go through reinitialization)
+        self._entry_slope = self.baseline_edge_bps * self.prop_skew_entry
+        self._exit_slope = self.baseline_edge_bps * self.prop_skew_exit
+        # "Quoter 10.00bps" prefix for debug logs, formatted once
+        self._log_tag = f"Quoter {float(self.baseline_edge_bps):.2f}bps"
+        # (prop_maintain, 1 - prop_maintain as Decimal); prop_maintain only changes on config reload
+        self._keep_factor_cache: tuple[Optional[float], Decimal] = (None, _ZERO)
+        # Last context that produced an empty decision (keep both orders). decide()
+        # is a pure function of the context, so an equal context decides the same.
+        self._last_idle_ctx: Optional[QuoterContext] = None
+        # (current_position, max_position, bid_edge, ask_edge): edges only move
+        # with position, which changes on fills, not every tick
+        self._edges_cache: tuple = (None, None, _ZERO, _ZERO)
 
     def _get_skewed_edges(self, ctx: QuoterContext) -> tuple[Decimal, Decimal]:
         """Calculate bid/ask edges with position skew applied."""
+        position, max_position, bid_edge, ask_edge = self._edges_cache
+        if position == ctx.current_position and max_position == ctx.max_position:
+            return bid_edge, ask_edge
+
         if ctx.max_position != 0:
             prop_of_max = ctx.current_position / ctx.max_position
         else:
-            prop_of_max = Decimal("0")
-        prop_of_max = max(Decimal("-1"), min(Decimal("1"), prop_of_max))
+            prop_of_max = _ZERO
+        prop_of_max = max(_NEG_ONE, min(_ONE, prop_of_max))
 
+        # baseline * (1 ± prop * skew) == baseline ± prop * (baseline * skew)
+        baseline = self.baseline_edge_bps
         if prop_of_max > 0:
             # Currently long: widen bids (slow to buy more), tighten asks (eager to sell)
-            bid_edge = self.baseline_edge_bps * (Decimal("1") + prop_of_max * self.prop_skew_entry)
-            ask_edge = self.baseline_edge_bps * (Decimal("1") - prop_of_max * self.prop_skew_exit)
+            bid_edge = baseline + prop_of_max * self._entry_slope
+            ask_edge = baseline - prop_of_max * self._exit_slope
         else:
             # Currently short: tighten bids (eager to buy), widen asks (slow to sell more)
-            bid_edge = self.baseline_edge_bps * (Decimal("1") - prop_of_max * self.prop_skew_exit)
-            ask_edge = self.baseline_edge_bps * (Decimal("1") + prop_of_max * self.prop_skew_entry)
+            bid_edge = baseline - prop_of_max * self._exit_slope
+            ask_edge = baseline + prop_of_max * self._entry_slope
 
+        self._edges_cache = (ctx.current_position, ctx.max_position, bid_edge, ask_edge)
         return bid_edge, ask_edge
 
     def _evaluate_existing_order(
@@ -69,57 +102,81 @@ class SkewQuoter(BaseQuoter):
         if existing is None:
             return True, None  # No order exists, need a new one
 
-        side_label = "bid" if side == OrderSide.BUY else "ask"
+        side_label = "bid" if side is _BUY else "ask"
 
         if existing.source == "preregistered":
-            logger.debug(f"Quoter {self.baseline_edge_bps}bps: {side_label.capitalize()} pending confirmation, holding")
+            logger.debug("{}: {} pending confirmation, holding", self._log_tag, side_label.capitalize())
             return False, None
 
         if existing.source == "unknown":
-            logger.debug(f"Quoter {self.baseline_edge_bps}bps: {side_label.capitalize()} in unknown state, holding")
+            logger.debug("{}: {} in unknown state, holding", self._log_tag, side_label.capitalize())
             return False, None
 
         # We have a price -- do the edge check
         if existing.price is None:
             return False, None  # Safety: shouldn't happen for on_chain/callback but be safe
 
-        order_edge = self.calculate_order_edge(existing.price, side, reference_price)
-        source_tag = f" [{existing.source}]" if existing.source == "callback" else ""
-
+        # Position limit cancels regardless of edge, so skip the Decimal edge math
         if stop_side:
             logger.debug(
-                f"Quoter {float(self.baseline_edge_bps):.2f}bps: "
-                f"Cancelling {side_label} @ {float(existing.price):.6f} "
-                f"(position limit exceeded){source_tag}"
+                "{}: Cancelling {} @ {:.6f} (position limit exceeded){}",
+                self._log_tag, side_label, existing.price,
+                " [callback]" if existing.source == "callback" else "",
             )
             return True, existing.cloid
 
-        if order_edge >= cancel_threshold:
-            logger.debug(
-                f"Quoter {float(self.baseline_edge_bps):.2f}bps: "
-                f"Keeping {side_label} @ {float(existing.price):.6f} "
-                f"(edge={float(order_edge):.1f} >= cancel_threshold={float(cancel_threshold):.1f}){source_tag}"
-            )
-            return False, None
+        # Compare against the price at the cancel threshold rather than dividing by
+        # the reference price per order: edge >= threshold <=> a bid at or below
+        # (an ask at or above) that price. The edge itself is only computed for logs.
+        threshold_price = self.price_from_edge(cancel_threshold, side, reference_price)
+        if side is _BUY:
+            keep = existing.price <= threshold_price
+        else:
+            keep = existing.price >= threshold_price
 
-        logger.debug(
-            f"Quoter {float(self.baseline_edge_bps):.2f}bps: "
-            f"Cancelling {side_label} @ {float(existing.price):.6f} "
-            f"(edge={float(order_edge):.1f} < cancel_threshold={float(cancel_threshold):.1f}){source_tag}"
+        logger.opt(lazy=True).debug(
+            "{}",
+            lambda: (
+                f"{self._log_tag}: "
+                f"{'Keeping' if keep else 'Cancelling'} {side_label} @ {float(existing.price):.6f} "
+                f"(edge={float(self.calculate_order_edge(existing.price, side, reference_price)):.1f} "
+                f"{'>=' if keep else '<'} cancel_threshold={float(cancel_threshold):.1f})"
+                f"{' [callback]' if existing.source == 'callback' else ''}"
+            ),
         )
+        if keep:
+            return False, None
         return True, existing.cloid
 
     def decide(self, ctx: QuoterContext) -> QuoterDecision:
+        # Quiet ticks (same price, position and orders as a tick that kept
+        # everything) skip the edge math entirely
+        if ctx == self._last_idle_ctx:
+            return QuoterDecision()
+        # Both sides stopped with nothing resting: no cancel or new order is
+        # possible, so skip the skew math
+        if (ctx.stop_bids and ctx.stop_asks
+                and ctx.existing_bid is None and ctx.existing_ask is None):
+            return QuoterDecision()
+
+        decision = self._decide(ctx)
+        self._last_idle_ctx = ctx if not (decision.cancels or decision.new_orders) else None
+        return decision
+
+    def _decide(self, ctx: QuoterContext) -> QuoterDecision:
         cancels = []
 
         bid_edge, ask_edge = self._get_skewed_edges(ctx)
-        maintain = Decimal(str(ctx.prop_maintain))
-        bid_cancel_threshold = bid_edge * (Decimal("1") - maintain)
-        ask_cancel_threshold = ask_edge * (Decimal("1") - maintain)
+        cached_maintain, keep_factor = self._keep_factor_cache
+        if cached_maintain != ctx.prop_maintain:
+            keep_factor = _ONE - Decimal(str(ctx.prop_maintain))
+            self._keep_factor_cache = (ctx.prop_maintain, keep_factor)
+        bid_cancel_threshold = bid_edge * keep_factor
+        ask_cancel_threshold = ask_edge * keep_factor
 
         # --- Evaluate existing bid ---
         need_bid, bid_cancel = self._evaluate_existing_order(
-            ctx.existing_bid, OrderSide.BUY, bid_cancel_threshold,
+            ctx.existing_bid, _BUY, bid_cancel_threshold,
             ctx.reference_price, ctx.stop_bids,
         )
         if bid_cancel:
@@ -127,69 +184,80 @@ class SkewQuoter(BaseQuoter):
 
         # --- Evaluate existing ask ---
         need_ask, ask_cancel = self._evaluate_existing_order(
-            ctx.existing_ask, OrderSide.SELL, ask_cancel_threshold,
+            ctx.existing_ask, _SELL, ask_cancel_threshold,
             ctx.reference_price, ctx.stop_asks,
         )
         if ask_cancel:
             cancels.append(ask_cancel)
 
         # --- Coupling: if one side replaced, force-replace the other ---
+        # The side being forced wasn't cancelled above (a cancel always comes with
+        # need=True), so its cloid can't already be in cancels
         if need_bid and not need_ask:
             if ctx.existing_ask and ctx.existing_ask.source == "preregistered":
-                logger.debug(f"Coupling: ask {ctx.existing_ask.cloid} still preregistered, skipping quoter this iteration")
+                logger.debug("Coupling: ask {} still preregistered, skipping quoter this iteration", ctx.existing_ask.cloid)
                 return QuoterDecision()
             need_ask = True
-            if ctx.existing_ask and ctx.existing_ask.cloid not in cancels:
+            if ctx.existing_ask:
                 cancels.append(ctx.existing_ask.cloid)
-                logger.debug(f"Coupling: cancelling ask {ctx.existing_ask.cloid} because bid was replaced")
+                logger.debug("Coupling: cancelling ask {} because bid was replaced", ctx.existing_ask.cloid)
         elif need_ask and not need_bid:
             if ctx.existing_bid and ctx.existing_bid.source == "preregistered":
-                logger.debug(f"Coupling: bid {ctx.existing_bid.cloid} still preregistered, skipping quoter this iteration")
+                logger.debug("Coupling: bid {} still preregistered, skipping quoter this iteration", ctx.existing_bid.cloid)
                 return QuoterDecision()
             need_bid = True
-            if ctx.existing_bid and ctx.existing_bid.cloid not in cancels:
+            if ctx.existing_bid:
                 cancels.append(ctx.existing_bid.cloid)
-                logger.debug(f"Coupling: cancelling bid {ctx.existing_bid.cloid} because ask was replaced")
+                logger.debug("Coupling: cancelling bid {} because ask was replaced", ctx.existing_bid.cloid)
 
         # --- Generate new orders ---
         new_orders = []
         final_need_bid = need_bid and not ctx.stop_bids
         final_need_ask = need_ask and not ctx.stop_asks
 
-        if final_need_bid:
-            bid_price = self.price_from_edge(bid_edge, OrderSide.BUY, ctx.reference_price)
-            new_orders.append(Order(
-                cloid=self.make_cloid("bid"),
-                order_type=OrderType.LIMIT,
-                side=OrderSide.BUY,
-                price=bid_price,
-                size=self.quantity,
-                post_only=False,
-            ))
-            logger.debug(
-                f"New bid: cloid={new_orders[-1].cloid} price={float(bid_price):.6f} "
-                f"size={float(self.quantity)} edge={float(bid_edge):.2f}bps"
-            )
+        # One clock read for both cloids (the bid-/ask- prefixes keep them distinct)
+        if final_need_bid or final_need_ask:
+            timestamp = time.time_ns() // 1_000_000
+            quantity = self.quantity
+            reference_price = ctx.reference_price
 
-        if final_need_ask:
-            ask_price = self.price_from_edge(ask_edge, OrderSide.SELL, ctx.reference_price)
-            new_orders.append(Order(
-                cloid=self.make_cloid("ask"),
-                order_type=OrderType.LIMIT,
-                side=OrderSide.SELL,
-                price=ask_price,
-                size=self.quantity,
-                post_only=False,
-            ))
-            logger.debug(
-                f"New ask: cloid={new_orders[-1].cloid} price={float(ask_price):.6f} "
-                f"size={float(self.quantity)} edge={float(ask_edge):.2f}bps"
-            )
+            if final_need_bid:
+                bid_price = self.price_from_edge(bid_edge, _BUY, reference_price)
+                bid_cloid = f"{self._cloid_prefix_bid}{timestamp}"
+                new_orders.append(Order(
+                    cloid=bid_cloid,
+                    order_type=_LIMIT,
+                    side=_BUY,
+                    price=bid_price,
+                    size=quantity,
+                    post_only=False,
+                ))
+                logger.debug(
+                    "New bid: cloid={} price={:.6f} size={} edge={:.2f}bps",
+                    bid_cloid, bid_price, quantity, bid_edge,
+                )
+
+            if final_need_ask:
+                ask_price = self.price_from_edge(ask_edge, _SELL, reference_price)
+                ask_cloid = f"{self._cloid_prefix_ask}{timestamp}"
+                new_orders.append(Order(
+                    cloid=ask_cloid,
+                    order_type=_LIMIT,
+                    side=_SELL,
+                    price=ask_price,
+                    size=quantity,
+                    post_only=False,
+                ))
+                logger.debug(
+                    "New ask: cloid={} price={:.6f} size={} edge={:.2f}bps",
+                    ask_cloid, ask_price, quantity, ask_edge,
+                )
 
         if new_orders:
             logger.debug(
-                f"Quoter {self.baseline_edge_bps}bps: Generating {len(new_orders)} new orders "
-                f"(bid={'yes' if final_need_bid else 'no'}, ask={'yes' if final_need_ask else 'no'})"
+                "{}: Generating {} new orders (bid={}, ask={})",
+                self._log_tag, len(new_orders),
+                "yes" if final_need_bid else "no", "yes" if final_need_ask else "no",
             )
 
         return QuoterDecision(cancels=cancels, new_orders=new_orders)